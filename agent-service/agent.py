@@ -1,25 +1,21 @@
-from typing import Dict, Any, Optional
-from abc import ABC, abstractmethod
-from dotenv import load_dotenv
-import json
+from typing import Dict, Any, Optional, Protocol, runtime_checkable
+import orjson
 import logging
 import asyncio
-import signal
+import functools
+import os
+import sys
 
 from livekit import agents, rtc
-from livekit.agents import AgentSession, Agent, RoomInputOptions
-from livekit.plugins import (
-    noise_cancellation,
-    silero,
-)
+from livekit.agents import AgentSession, Agent, RoomInputOptions, JobProcess
 from utils.config_fetcher import get_agent_config_from_room
 from utils.plugin_factory import ModelFactory
-from utils.config_processor import ConfigProcessor
 from utils.session_monitors import SessionMonitors
 from utils.tool_loader import ToolLoader
-from utils.room_extractor import extract_room_name, extract_phone_number as extract_agent_conf_id
+from utils.api_client import close_shared_sessions
+from utils.room_extractor import extract_room_name
+from utils.config_processor import default_min_silence_duration
 from utils.call_history import (
-    start_call_recording,
     update_call_config,
     update_call_stage,
     end_call_recording
@@ -29,34 +25,217 @@ from assistant_factory import AgentConfig
 # Configure logging
 logger = logging.getLogger(__name__)
 
-load_dotenv()
+# Use uvloop for the worker and job processes when it is available; this runs
+# at import so spawned job processes pick up the policy too
+if sys.platform != "win32":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
 
 
-class AbstractAgent(Agent, ABC):
-    """Abstract base class for all agents"""
+def _try_json(value: Any) -> Any:
+    """Parse a string as JSON only if it looks like a JSON object or array
 
-    @abstractmethod
-    async def initialize(self, ctx: agents.JobContext) -> None:
-        """Initialize the agent with context"""
-        pass
+    Plain strings such as SIP identities are rejected by a structural check
+    instead of raising and catching a decode error.
 
-    @abstractmethod
-    async def handle_participant_connected(self, participant: rtc.RemoteParticipant) -> None:
-        """Handle participant connection"""
-        pass
+    Returns:
+        The parsed value, or None if the string is not JSON
+    """
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    if not value or value[0] not in "{[":
+        return None
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return None
+
+
+def _parse_metadata_str(metadata: str) -> Dict[str, Any]:
+    """Parse a participant metadata JSON string into a fresh dict
+
+    Returns an empty dict if the metadata is valid JSON but not an object.
+
+    Raises:
+        orjson.JSONDecodeError: If the metadata is not valid JSON
+    """
+    parsed = orjson.loads(metadata)
+    return parsed if isinstance(parsed, dict) else {}
+
+
+# Default time to wait for the caller to join a telephony room
+DEFAULT_PARTICIPANT_WAIT_TIMEOUT = 10.0
+
+# Shutdown reason LiveKit gives a job when its room disconnects
+ROOM_DISCONNECTED_SHUTDOWN_REASON = "room disconnected"
+
+
+# Heavy plugins are imported on first use rather than at module import. LiveKit
+# plugins register themselves on import and must do so on the main thread, so
+# these helpers are only called from the event loop, never from to_thread.
+@functools.cache
+def _silero():
+    """Import the Silero VAD plugin on first use"""
+    from livekit.plugins import silero
+    return silero
+
+
+@functools.cache
+def _noise_cancellation():
+    """Import the noise cancellation plugin on first use"""
+    from livekit.plugins import noise_cancellation
+    return noise_cancellation
+
+
+def _load_silero_vad(min_silence_duration: float):
+    """Load the Silero VAD with the options used for every session
+
+    The pinned livekit-plugins-silero bundles the Silero v5 ONNX model and
+    runs it on a single-threaded, sequential CPU session, so only the
+    detection options are set here.
+    """
+    return _silero().VAD.load(
+        min_silence_duration=min_silence_duration,
+        sample_rate=16000,
+        force_cpu=True,
+    )
+
+
+# Loaded VADs are kept per worker process, keyed by silence duration rounded
+# to 10 ms, so configurations that differ only slightly share an instance
+VAD_CACHE_MAX_ENTRIES = 8
+
+
+def _vad_cache_key(min_silence_duration: float) -> float:
+    """Quantize a silence duration to the VAD cache granularity"""
+    return round(min_silence_duration, 2)
+
+
+def prewarm(proc: JobProcess) -> None:
+    """Load process-wide models once per worker process instead of per call"""
+    key = _vad_cache_key(default_min_silence_duration())
+    proc.userdata["vads"] = {key: _load_silero_vad(key)}
+
+
+# Module-level fire-and-forget tasks; the event loop only keeps weak references
+# to tasks, so these are held here until they finish
+_background_tasks: set = set()
+
+
+def _spawn_background(coro) -> asyncio.Task:
+    """Start a task that outlives its caller without being garbage collected"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+# Turn detection modes that can be selected from the agent configuration
+TURN_DETECTION_MODES = ("stt", "vad")
+
+
+def _turn_detection_mode(raw_config: Dict[str, Any], stt) -> Optional[str]:
+    """Resolve the configured turn detection mode for the session
+
+    "stt" relies on the STT provider's end-of-speech events and is only used
+    with streaming STT; anything else leaves the AgentSession default.
+
+    Args:
+        raw_config: Raw configuration dictionary from the config service
+        stt: STT instance the session will use
+
+    Returns:
+        Turn detection mode, or None for the AgentSession default
+    """
+    mode = raw_config.get("turn_detection")
+    if mode not in TURN_DETECTION_MODES:
+        return None
+    if mode == "stt" and not stt.capabilities.streaming:
+        logger.warning("STT turn detection needs a streaming STT, using default")
+        return None
+    return mode
+
+
+async def _synthesize_frames(tts, text: str, frames: asyncio.Queue) -> None:
+    """Synthesize text with the given TTS, queueing each frame as it arrives
+
+    None is queued once synthesis ends, whether it finished or failed, so
+    playback can start on the first frame and stop after the last.
+
+    Args:
+        tts: TTS instance the session will use
+        text: Text to synthesize
+        frames: Queue receiving rtc.AudioFrame in playout order
+    """
+    try:
+        async with tts.synthesize(text) as stream:
+            async for audio in stream:
+                frames.put_nowait(audio.frame)
+    except Exception as e:
+        logger.warning("Welcome message pre-synthesis failed: %s", e)
+    finally:
+        frames.put_nowait(None)
+
+
+async def _queued_frames(first_frame, frames: asyncio.Queue):
+    """Yield queued audio frames for AgentSession.say(audio=...) while
+    synthesis is still producing them"""
+    frame = first_frame
+    while frame is not None:
+        yield frame
+        frame = await frames.get()
+
+
+@runtime_checkable
+class AgentProtocol(Protocol):
+    """Interface the entrypoint expects from an agent (structural, no base class)"""
 
-    @abstractmethod
     async def start_session(self) -> None:
         """Start the agent session"""
-        pass
+        ...
 
-    @abstractmethod
     async def end_session(self, reason: str = None) -> None:
         """End the agent session"""
-        pass
-
+        ...
+
+
+# Noise cancellation options hold no per-call state, so one instance per call
+# type is created on first use and shared by every session in the process
+@functools.cache
+def bvc_noise_cancellation():
+    """Shared noise cancellation for web participants"""
+    return _noise_cancellation().BVC()
+
+
+@functools.cache
+def bvc_telephony_noise_cancellation():
+    """Shared noise cancellation for SIP participants"""
+    return _noise_cancellation().BVCTelephony()
+
+
+class Assistant(Agent):
+    # Agent itself is not slotted, so instances keep a __dict__ for the base
+    # class attributes; the assistant's own state lives in these slots
+    __slots__ = (
+        "_session_id",
+        "_interaction_stage",
+        "_agent_session",
+        "_agent_config",
+        "_raw_config",
+        "_room_name",
+        "_participant_context",
+        "_audio_processor",
+        "_ctx",
+        "_ended",
+        "_background_tasks",
+        "_monitors",
+        "_interruption_sensitivity_control",
+    )
 
-class Assistant(AbstractAgent):
     def __init__(self,
                  instructions: str = "You are a helpful voice AI assistant.",
                  session_id: str = None,
@@ -80,12 +259,14 @@ class Assistant(AbstractAgent):
         self._raw_config = raw_config  # Store raw config for reference
         self._room_name: Optional[str] = None
         self._participant_context: Optional[Dict] = None
-        self._audio_processor = noise_cancellation.BVC()
+        self._audio_processor = None  # Chosen once the participant type is known
         self._ctx = ctx  # Store the job context
+        # Resolved once the first end_session call has finished tearing down
+        self._ended: Optional[asyncio.Future] = None
+        self._background_tasks: set = set()  # Strong refs until each task finishes
 
         # Initialize session monitors
         self._monitors = SessionMonitors(self)
-        self._voice_activity_detection_control = None
         self._interruption_sensitivity_control = None
 
     @property
@@ -103,168 +284,28 @@ class Assistant(AbstractAgent):
         """Get the job context"""
         return self._ctx
 
+    @property
+    def audio_processor(self):
+        """Get the noise cancellation for this call, defaulting to web BVC"""
+        return self._audio_processor or bvc_noise_cancellation()
+
     async def update_interaction_stage(self, stage: str) -> None:
         """Update and record the current interaction stage
 
         Args:
             stage: The new stage of the conversation
         """
+        # Nothing to record if the stage did not change
+        if stage == self._interaction_stage:
+            return
         self._interaction_stage = stage
         # Only update call stage if recording is enabled (session_id exists)
         if self._session_id:
             await update_call_stage(self._session_id, stage)
             logger.info(
-                f"Session {self._session_id}: Stage updated to {stage}")
+                "Session %s: Stage updated to %s", self._session_id, stage)
         else:
-            logger.info(f"Stage updated to {stage} (recording disabled)")
-
-    async def initialize(self, ctx: agents.JobContext) -> None:
-        """Initialize the agent with the given context
-
-        DEPRECATED: This method is no longer used in the refactored flow.
-        The new entrypoint() uses create_assistant_with_config() factory function instead.
-        Kept for backward compatibility with AbstractAgent interface.
-
-        Args:
-            ctx: The job context containing room and connection information
-        """
-        logger.warning(
-            "initialize() called - this method is deprecated in the refactored flow")
-
-        # Store the job context
-        self._ctx = ctx
-
-        # Establish connection
-        await ctx.connect()
-
-        # Initialize room context
-        self._room_name = extract_room_name(ctx)
-        logger.info(f"Initializing agent for room: {self._room_name}")
-
-        # Register participant handler
-        def on_participant_join(participant: rtc.RemoteParticipant):
-            asyncio.create_task(self.handle_participant_connected(participant))
-
-        # Log initial room state
-        logger.info(f"Room context: {ctx.room}")
-        try:
-            self._participant_context = ctx.room.remote_participants or (
-                json.loads(ctx.room.metadata) if ctx.room.metadata else {}
-            )
-        except json.JSONDecodeError:
-            logger.error(f"Failed to parse room metadata: {ctx.room.metadata}")
-        logger.info(f"Existing participants: {ctx.room.remote_participants}")
-
-        # Set up event listener
-        ctx.room.on("participant_connected")(on_participant_join)
-
-    async def handle_participant_connected(self, participant: rtc.RemoteParticipant) -> None:
-        """Process new participant connection and initialize interaction
-
-        DEPRECATED: This method is no longer used in the refactored flow.
-        The new entrypoint() uses create_assistant_with_config() factory function instead.
-        Kept for backward compatibility with AbstractAgent interface.
-
-        Args:
-            participant: The newly connected participant
-        """
-        logger.warning(
-            "handle_participant_connected() called - this method is deprecated in the refactored flow")
-
-        # Log comprehensive participant information
-        logger.info("New participant connection:", extra={
-            "participant_details": str(participant),
-            "connection_type": participant.kind,
-            "identity": participant.identity,
-            "metadata": participant.metadata
-        })
-
-        try:
-            # Extract participant context
-            context = self._parse_participant_metadata(participant)
-
-            # Determine interaction type and configuration ID
-            if participant.kind == rtc.ParticipantKind.PARTICIPANT_KIND_SIP:
-                call_type = "inbound"
-                config_id = extract_agent_conf_id(self._room_name)
-                logger.info(f"Voice call configuration ID: {config_id}")
-            else:
-                call_type = "web"
-                config_id = participant.identity
-                logger.info("Web interaction initialized")
-
-            # Configure audio processing based on participant type
-            self._audio_processor = (noise_cancellation.BVCTelephony()
-                                     if participant.kind == rtc.ParticipantKind.PARTICIPANT_KIND_SIP
-                                     else noise_cancellation.BVC())
-
-            # Update interaction context
-            self._participant_context["call_type"] = context.get(
-                "call_type", call_type)
-
-            # For deprecated flow, we'd need raw_config here but don't have it
-            # So we skip the recording initialization in deprecated path
-            logger.warning(
-                "Skipping recording initialization in deprecated path")
-
-            if self._session_id is None:
-                logger.info(
-                    "Session recording disabled - no call history will be saved")
-        except Exception as e:
-            logger.error(f"Error handling participant connection: {str(e)}")
-            self._participant_context = {}
-            return
-
-    def _parse_participant_metadata(self, participant: rtc.RemoteParticipant) -> Dict:
-        """Extract and parse participant metadata
-
-        Args:
-            participant: The participant whose metadata needs to be parsed
-
-        Returns:
-            Dict containing parsed metadata or empty dict if parsing fails
-        """
-        try:
-            if participant.metadata:
-                return json.loads(participant.metadata)
-        except json.JSONDecodeError:
-            logger.error(
-                f"Failed to parse participant metadata: {participant.metadata}")
-        return {}
-
-    async def _start_call_recording(self, config_id: str, interaction_type: str, raw_config: Dict[str, Any]) -> Optional[str]:
-        """Initialize session recording and monitoring if not opted out
-
-        Args:
-            config_id: Unique identifier for agent configuration
-            interaction_type: Type of interaction (web/voice)
-            raw_config: Pre-fetched raw configuration dictionary from API
-
-        Returns:
-            str: The unique session identifier, or None if recording is disabled
-        """
-        try:
-            # Skip recording if opt_out_sensitive_data is True
-            if raw_config.get("opt_out_sensitive_data", False):
-                logger.info(
-                    f"Call recording disabled due to compliance settings: {raw_config.get('opt_out_sensitive_data')}")
-                logger.info(
-                    "No call history or sensitive data will be recorded for this session")
-                return None
-
-            # Proceed with recording since opt_out_sensitive_data is False or not set
-            session_id = await start_call_recording(
-                phone_number=config_id,
-                room_name=self._room_name,
-                call_type=interaction_type
-            )
-            logger.info(f"Initialized session recording: {session_id}")
-            return session_id
-
-        except Exception as e:
-            logger.error(f"Error starting call recording: {str(e)}")
-            # Default to not recording if there's an error
-            return None
+            logger.info("Stage updated to %s (recording disabled)", stage)
 
     async def _load_config(self) -> None:
         """Validate and finalize agent configuration (config should already be loaded)"""
@@ -278,56 +319,24 @@ class Assistant(AbstractAgent):
             )
             self._raw_config = raw_config
 
-            # Process and create AgentConfig using ConfigProcessor
-            if raw_config:
-                self._voice_activity_detection_control = raw_config.get(
-                    'voice_activity_detection_control', 0.20)
-
-            self._agent_config = AgentConfig(
-                ctx=self._ctx,
-                stt_config=raw_config if raw_config else {},
-                tts_config=raw_config if raw_config else {},
-                llm_config=raw_config if raw_config else {},
-                instructions=raw_config.get(
-                    "assistant_instruction",
-                    "You are a helpful voice AI assistant."
-                ) if raw_config else "You are a helpful voice AI assistant.",
-                welcome_message=raw_config.get(
-                    "static_message",
-                    "Hello! How can I help you today?"
-                ) if raw_config else "Hello! How can I help you today?",
-                welcome_type=raw_config.get(
-                    "welcome_message_type",
-                    "human_initiates"
-                ) if raw_config else "human_initiates",
-                end_call_on_silence=raw_config.get(
-                    "end_call_on_silence", False) if raw_config else False,
-                silence_duration=raw_config.get(
-                    "silence_duration", 60) if raw_config else 60,
-                max_call_duration=raw_config.get(
-                    "max_call_duration", 1800) if raw_config else 1800,
-                tools=ConfigProcessor.prepare_tool_configs(
-                    raw_config.get("tools", {}) if raw_config else {})
-            )
+            # An empty config yields the defaults
+            self._agent_config = AgentConfig.from_raw(self._ctx, raw_config)
         else:
-            # Config was pre-loaded, just extract VAD control if needed
-            if self._raw_config:
-                self._voice_activity_detection_control = self._raw_config.get(
-                    'voice_activity_detection_control', 0.20)
             logger.info("Using pre-loaded agent configuration")
 
         # Update session with configuration if recording is enabled
         if self._session_id and self._raw_config:
             await update_call_config(self._session_id, self._raw_config)
             logger.info(
-                f"Updated call configuration for recorded session: {self._session_id}")
+                "Updated call configuration for recorded session: %s", self._session_id)
         else:
             logger.info(
                 "Skipping call config update - recording disabled due to privacy settings")
 
-        logger.info("Agent configuration validated", extra={
-            "config": self._raw_config if self._raw_config else "default"
-        })
+        # The full config is only rendered at DEBUG
+        logger.info("Agent configuration validated (%s)",
+                    "from API" if self._raw_config else "default")
+        logger.debug("Agent configuration: %s", self._raw_config)
 
     async def start_session(self) -> None:
         """Start the agent session"""
@@ -338,12 +347,11 @@ class Assistant(AbstractAgent):
         # tools_from_config = await ToolLoader.create_dynamic_tools([
         #     "fb0f2b86-a2bc-423b-a3af-3b9eee86675b"
         # ], "c00db557-5001-458d-8d97-78cf0af4d10a")
-        logger.info(f"tools_list: {self._raw_config.get('tools_list', [])}")
-        logger.info(f"workspace_id: {self._raw_config.get('workspace_id')}")
-        logger.info(f"raw_config: {self._raw_config}")
-        
-        tools_from_config = await ToolLoader.create_dynamic_tools(self._raw_config.get("tools_list", []), self._raw_config.get("workspace_id"), self.ctx)
-        logger.info(f"tools_from_config loaded: {len(tools_from_config)} tools")
+        # The raw config itself is already logged by _load_config at DEBUG
+        logger.debug("tools_list: %s, workspace_id: %s",
+                     self._raw_config.get('tools_list', []),
+                     self._raw_config.get('workspace_id'))
+
         # Start call duration and silence monitors using SessionMonitors
         self._monitors.start_monitoring(
             max_call_duration=self._agent_config.max_call_duration,
@@ -351,21 +359,48 @@ class Assistant(AbstractAgent):
             silence_duration=self._agent_config.silence_duration
         )
 
-        # Create model components
-        stt = ModelFactory.create_stt(self._agent_config.stt_config)
-        llm = ModelFactory.create_llm(self._agent_config.llm_config)
-        tts = ModelFactory.create_tts(self._agent_config.tts_config)
+        # Create model components and fetch tool schemas concurrently; the
+        # model constructors are sync and may do network / model loading, so
+        # run them off the event loop
+        tools_from_config, stt, llm, tts, vad = await asyncio.gather(
+            self._create_tools(
+                self._raw_config.get("tools_list", []),
+                self._raw_config.get("workspace_id")),
+            asyncio.to_thread(ModelFactory.create_stt,
+                              self._agent_config.stt_config),
+            asyncio.to_thread(ModelFactory.create_llm,
+                              self._agent_config.llm_config),
+            asyncio.to_thread(ModelFactory.create_tts,
+                              self._agent_config.tts_config),
+            self._load_vad(self._agent_config.vad_control or 0.05),
+        )
 
-        logger.info(f"tts: {tts}")
-        logger.info(f"llm: {llm}")
-        logger.info(f"stt: {stt}")
+        logger.info("tools_from_config loaded: %s tools", len(tools_from_config))
+        # Plugin reprs can be large and embed credentials; skip building the
+        # records entirely unless DEBUG is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("tts: %s, llm: %s, stt: %s", tts, llm, stt)
+
+        # Open the TTS provider connection in the background (a no-op for
+        # plugins without a connection pool) so the first reply skips the
+        # handshake
+        tts.prewarm()
+
+        # A static greeting is known up front, so synthesize it while the
+        # session is being wired up instead of after it has started
+        greeting_frames = None
+        if (self._agent_config.welcome_type == "ai_static"
+                and self._agent_config.welcome_message):
+            greeting_frames = asyncio.Queue()
+            self._spawn(_synthesize_frames(
+                tts, self._agent_config.welcome_message, greeting_frames))
 
         self._agent_session = AgentSession(
             stt=stt,
             llm=llm,
             tts=tts,
-            vad=silero.VAD.load(
-                min_silence_duration=self._voice_activity_detection_control or 0.05),
+            vad=vad,
+            turn_detection=_turn_detection_mode(self._raw_config, stt),
             allow_interruptions=True,
         )
 
@@ -374,7 +409,7 @@ class Assistant(AbstractAgent):
             room=self._ctx.room,
             agent=self,
             room_input_options=RoomInputOptions(
-                noise_cancellation=self._audio_processor,
+                noise_cancellation=self.audio_processor,
             ),
         )
 
@@ -391,47 +426,114 @@ class Assistant(AbstractAgent):
                 instructions="Greet the user naturally and ask how you can help them today."
             )
         elif self._agent_config.welcome_type == "ai_static":
-            # AI initiates with static message
-            await self._agent_session.say(self._agent_config.welcome_message)
-         
+            # AI initiates with static message, playing the pre-synthesized
+            # audio as it arrives; if none was produced, synthesize as usual
+            first_frame = None
+            if greeting_frames is not None:
+                first_frame = await greeting_frames.get()
+            if first_frame is not None:
+                await self._agent_session.say(
+                    self._agent_config.welcome_message,
+                    audio=_queued_frames(first_frame, greeting_frames))
+            else:
+                await self._agent_session.say(self._agent_config.welcome_message)
+
         # For "human_initiates", we don't send any welcome message and wait for the user to speak first
 
+    def _spawn(self, coro) -> asyncio.Task:
+        """Start a task owned by this session; it is cancelled in end_session"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def _create_tools(self, tool_ids: list, workspace_id: Optional[str]) -> list:
+        """Create the configured dynamic tools, falling back to no tools
+
+        A broken tool schema should not fail the call, unlike a missing
+        STT/LLM/TTS, so errors here are logged rather than raised.
+
+        Args:
+            tool_ids: Tool configuration IDs from the agent configuration
+            workspace_id: Workspace the tools belong to
+
+        Returns:
+            List of tool functions, empty if they could not be created
+        """
+        try:
+            return await ToolLoader.create_dynamic_tools(tool_ids, workspace_id, self.ctx)
+        except Exception as e:
+            logger.error("Failed to create dynamic tools, continuing without them: %s", e)
+            return []
+
+    async def _load_vad(self, min_silence_duration: float):
+        """Return a VAD from the worker's cache, loading and caching a new one
+        only for a silence duration the process has not seen yet
+
+        Args:
+            min_silence_duration: Minimum silence duration for end of speech
+        """
+        key = _vad_cache_key(min_silence_duration)
+        proc = getattr(self._ctx, "proc", None)
+        vads = proc.userdata.setdefault("vads", {}) if proc is not None else None
+        if vads and key in vads:
+            logger.info("Using cached VAD (min_silence_duration=%s)", key)
+            return vads[key]
+
+        # Import (and so register) the plugin on the event loop thread before
+        # loading the model in a worker thread
+        _silero()
+        vad = await asyncio.to_thread(_load_silero_vad, key)
+        if vads is not None and len(vads) < VAD_CACHE_MAX_ENTRIES:
+            vads[key] = vad
+        return vad
+
     async def end_session(self, reason: str = None) -> None:
-        """End the agent session and terminate the call completely"""
-        logger.info(f"Ending session with reason: {reason}")
+        """End the agent session and terminate the call completely
+
+        The job shutdown callback, the monitors and the entrypoint's error
+        path can all end the session. Only the first caller tears it down;
+        later callers wait for that teardown to finish.
+        """
+        if self._ended is not None:
+            logger.info("Session already ending, ignoring reason: %s", reason)
+            # Shielded so a cancelled waiter does not cancel the teardown
+            await asyncio.shield(self._ended)
+            return
+        self._ended = asyncio.get_running_loop().create_future()
+        try:
+            await self._end_session(reason)
+        finally:
+            self._ended.set_result(None)
+
+    async def _end_session(self, reason: Optional[str]) -> None:
+        """Tear down the session; called once, from end_session"""
+        logger.info("Ending session with reason: %s", reason)
 
         # Cancel monitoring tasks using SessionMonitors
         await self._monitors.cancel_all()
 
-        # Stop the agent session
-        if self._agent_session:
+        # Work started for the session (e.g. greeting synthesis) is of no use
+        # once it ends
+        pending = list(self._background_tasks)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        # Stop the agent session before finalizing the recording, and only
+        # disconnect from the room last: the disconnect shuts the job down,
+        # which must not happen while the call history is still being sent
+        agent_session = self._agent_session
+        self._agent_session = None
+        if agent_session:
             logger.info("Stopping agent session")
-            await self._agent_session.aclose()
-            self._agent_session = None
-
-        # Record the call ending if recording was enabled
-        if self._session_id:
-            logger.info(
-                f"Recording call completion for session: {self._session_id}")
             try:
-                if reason:
-                    await end_call_recording(
-                        call_id=self._session_id,
-                        status="dropped",
-                        reason=reason
-                    )
-                else:
-                    await end_call_recording(
-                        call_id=self._session_id,
-                        status="completed",
-                        outcomes={
-                            "final_stage": self._interaction_stage,
-                            "successful": True
-                        }
-                    )
-                logger.info("Call recording completed successfully")
+                await agent_session.aclose()
             except Exception as e:
-                logger.error(f"Error finalizing call recording: {str(e)}")
+                logger.error("Error during agent session close: %s", e)
+
+        if self._session_id:
+            await self._finalize_call_recording(reason)
         else:
             logger.info(
                 "Session ended (no recording to finalize - disabled due to compliance settings)")
@@ -439,30 +541,58 @@ class Assistant(AbstractAgent):
         # Terminate the call by disconnecting from the room
         await self._terminate_call(reason)
 
+    async def _finalize_call_recording(self, reason: Optional[str]) -> None:
+        """Record the call ending if recording was enabled
+
+        Args:
+            reason: Reason the call was dropped, or None if it completed normally
+        """
+        if not self._session_id:
+            return
+
+        logger.info(
+            "Recording call completion for session: %s", self._session_id)
+        try:
+            if reason:
+                await end_call_recording(
+                    call_id=self._session_id,
+                    status="dropped",
+                    reason=reason
+                )
+            else:
+                await end_call_recording(
+                    call_id=self._session_id,
+                    status="completed",
+                    outcomes={
+                        "final_stage": self._interaction_stage,
+                        "successful": True
+                    }
+                )
+            logger.info("Call recording completed successfully")
+        except Exception as e:
+            logger.error("Error finalizing call recording: %s", e)
+
     async def _terminate_call(self, reason: str = None) -> None:
         """Terminate the call by disconnecting from the room and cleaning up resources"""
         try:
             if self._ctx and self._ctx.room:
                 logger.info(
-                    f"Terminating call - disconnecting from room: {self._room_name}")
+                    "Terminating call - disconnecting from room: %s", self._room_name)
 
                 # Disconnect the local participant from the room
                 await self._ctx.room.disconnect()
                 logger.info("Successfully disconnected from room")
 
-                # Optional: Add a small delay to ensure cleanup completes
-                await asyncio.sleep(1)
-
             else:
                 logger.warning(
                     "No room context available for call termination")
 
         except Exception as e:
-            logger.error(f"Error during call termination: {str(e)}")
+            logger.error("Error during call termination: %s", e)
             # Continue with cleanup even if room disconnection fails
 
         logger.info(
-            f"Call terminated successfully. Reason: {reason or 'normal completion'}")
+            "Call terminated successfully. Reason: %s", reason or 'normal completion')
 
 
 async def entrypoint(ctx: agents.JobContext):
@@ -471,73 +601,111 @@ async def entrypoint(ctx: agents.JobContext):
     from assistant_factory import create_assistant_with_config
 
     assistant = None
+
+    async def on_shutdown(reason: str) -> None:
+        # The worker traps SIGINT/SIGTERM and shuts each job down through its
+        # shutdown callbacks. They run concurrently, so the call is ended
+        # here, before the shared HTTP sessions it reports through are closed;
+        # if a monitor or the error path is already ending it, end_session
+        # waits for that teardown to finish
+        if assistant is not None:
+            # The room closing under the job (e.g. after the caller hangs up)
+            # is how a call normally ends and is recorded as completed; any
+            # other shutdown, such as the worker draining, drops the call
+            if reason == ROOM_DISCONNECTED_SHUTDOWN_REASON:
+                await assistant.end_session()
+            else:
+                await assistant.end_session(reason or "job_shutdown")
+        await close_shared_sessions()
+
+    ctx.add_shutdown_callback(on_shutdown)
     try:
         # Connect to the room first
         await ctx.connect()
         room_name = extract_room_name(ctx)
-        logger.info(f"Connected to room: {room_name}")
+        logger.info("Connected to room: %s", room_name)
+
+        # Bind the room state once; each is a property on the LiveKit room
+        room = ctx.room
+        room_metadata = room.metadata
+        remote_participants = room.remote_participants
 
-        # Parse initial room metadata
+        # Parse initial room metadata. This is a fresh dict: the context is
+        # updated with participant metadata below and must not alias room state
         try:
-            participant_context = ctx.room.remote_participants or (
-                json.loads(ctx.room.metadata) if ctx.room.metadata else {}
-            )
-        except json.JSONDecodeError:
-            logger.error(f"Failed to parse room metadata: {ctx.room.metadata}")
+            participant_context = (
+                _parse_metadata_str(room_metadata) if room_metadata else {})
+        except orjson.JSONDecodeError:
+            logger.error("Failed to parse room metadata: %s", room_metadata)
             participant_context = {}
 
-        logger.info(
-            f"Initial participants in room: {ctx.room.remote_participants}")
+        logger.debug("Initial participants in room: %s", remote_participants)
 
         # Check if participant is already in the room (web calls)
         participant = None
-        if ctx.room.remote_participants:
-            # Get the first remote participant (usually there's only one)
-            participant = list(ctx.room.remote_participants.values())[0]
-            logger.info(f"Participant already in room: {participant.identity}")
+        if remote_participants:
+            # Take the first remote participant (usually there's only one)
+            # without copying the participant map
+            participant = next(iter(remote_participants.values()))
+            logger.info("Participant already in room: %s", participant.identity)
         else:
             # Wait for participant to connect (telephony calls)
             participant_connected = asyncio.Event()
             participant_ref = {"participant": None}
 
             def on_participant_join(participant: rtc.RemoteParticipant):
-                logger.info(f"Participant joined: {participant.identity}")
+                # Only the first participant is used for the call
+                if participant_connected.is_set():
+                    return
+                logger.info("Participant joined: %s", participant.identity)
                 participant_ref["participant"] = participant
                 participant_connected.set()
 
-            # Register participant connection handler
-            ctx.room.on("participant_connected")(on_participant_join)
+            # Register a one-shot participant connection handler
+            room.on("participant_connected", on_participant_join)
+
+            # Telephony configuration is keyed by the number in the room name,
+            # so warm the config cache for the usual inbound case while the
+            # caller is still joining
+            prefetch = _spawn_background(
+                get_agent_config_from_room(room_name, {"direction": "inbound"}))
 
-            # Wait for participant with timeout (10 seconds)
+            wait_timeout = float(os.getenv(
+                "PARTICIPANT_WAIT_TIMEOUT", DEFAULT_PARTICIPANT_WAIT_TIMEOUT))
             try:
-                await asyncio.wait_for(participant_connected.wait(), timeout=10.0)
+                await asyncio.wait_for(participant_connected.wait(),
+                                       timeout=wait_timeout)
                 participant = participant_ref["participant"]
-                logger.info(f"Participant connected: {participant.identity}")
+                logger.info("Participant connected: %s", participant.identity)
             except asyncio.TimeoutError:
+                prefetch.cancel()
                 logger.error("Timeout waiting for participant to connect")
                 raise Exception(
                     "No participant connected within timeout period")
+            finally:
+                # The handler is only needed until the first participant joins
+                room.off("participant_connected", on_participant_join)
 
         # Parse participant metadata
         try:
             if participant.metadata:
-                context = json.loads(participant.metadata)
+                context = _parse_metadata_str(participant.metadata)
                 participant_context.update(context)
-                logger.info(f"Parsed participant metadata: {context}")
+                logger.debug("Parsed participant metadata: %s", context)
             # Also check if identity contains metadata (LiveKit sometimes puts it there)
             elif participant.identity:
-                try:
-                    context = json.loads(participant.identity)
+                context = _try_json(participant.identity)
+                if isinstance(context, dict):
                     participant_context.update(context)
                     logger.info(
-                        f"Parsed participant identity as metadata: {context}")
-                except (json.JSONDecodeError, TypeError):
+                        "Parsed participant identity as metadata: %s", context)
+                else:
                     # Identity is just a regular string, not JSON
                     logger.info(
-                        f"Participant identity is not JSON: {participant.identity}")
-        except json.JSONDecodeError:
+                        "Participant identity is not JSON: %s", participant.identity)
+        except orjson.JSONDecodeError:
             logger.error(
-                f"Failed to parse participant metadata: {participant.metadata}")
+                "Failed to parse participant metadata: %s", participant.metadata)
 
         # Create assistant with configuration from API (deferred instantiation)
         assistant = await create_assistant_with_config(
@@ -548,26 +716,27 @@ async def entrypoint(ctx: agents.JobContext):
         )
 
         logger.info("Assistant instantiated with API configuration")
-
-        # Set up signal handlers for graceful shutdown
-        loop = asyncio.get_event_loop()
-
-        def handle_signal(sig, frame):
-            logger.info(f"Received signal {sig}, ending call")
-            asyncio.create_task(assistant.end_session("system_interrupt"))
-
-        for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(sig, lambda s=sig: handle_signal(s, None))
+        # Interface check only runs in debug mode (stripped under -O)
+        assert isinstance(assistant, AgentProtocol)
 
         # Start the assistant session
         await assistant.start_session()
 
     except Exception as e:
-        logger.error(f"Error in agent entrypoint: {e}")
+        logger.error("Error in agent entrypoint: %s", e)
         if assistant and assistant.session_id:
             await assistant.end_session(str(e))
         raise
 
 
 if __name__ == "__main__":
-    agents.cli.run_app(agents.WorkerOptions(entrypoint_fnc=entrypoint))
+    # Load .env once in the supervisor; job processes are started from it and
+    # inherit the environment instead of re-parsing the file
+    from dotenv import load_dotenv
+    load_dotenv()
+    # Register the plugins in the supervisor process so CLI commands such as
+    # download-files see them; job processes still import them lazily
+    _silero()
+    _noise_cancellation()
+    agents.cli.run_app(agents.WorkerOptions(
+        entrypoint_fnc=entrypoint, prewarm_fnc=prewarm))
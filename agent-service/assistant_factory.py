@@ -5,23 +5,27 @@ This module provides a factory function that fetches configuration from the API,
 creates an AgentConfig, and instantiates an Assistant with proper settings.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from livekit import agents, rtc
-from livekit.plugins import noise_cancellation
 from dataclasses import dataclass
 
-from utils.config_fetcher import get_agent_config_from_room
-from utils.config_processor import ToolConfig
-from utils.call_history import start_call_recording
+from utils.config_fetcher import get_agent_config_from_room, quick_opt_out_check
+from utils.config_processor import (
+    ConfigProcessor,
+    ToolConfig,
+    default_min_silence_duration,
+)
+from utils.call_history import start_call_recording, discard_call_recording
 from utils.room_extractor import extract_phone_number as extract_agent_conf_id
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentConfig:
-    """Data class to hold agent configuration"""
+    """Immutable data class to hold agent configuration"""
     ctx: agents.JobContext
     stt_config: Dict[str, Any]
     tts_config: Dict[str, Any]
@@ -33,6 +37,41 @@ class AgentConfig:
     silence_duration: int
     max_call_duration: int
     tools: Dict[str, ToolConfig]
+    vad_control: Optional[float]
+
+    @classmethod
+    def from_raw(cls, ctx: agents.JobContext,
+                 raw_config: Optional[Dict[str, Any]]) -> "AgentConfig":
+        """Build an AgentConfig from the API configuration
+
+        Args:
+            ctx: Job context for the agent session
+            raw_config: Configuration from the API; empty or None yields the
+                defaults
+
+        Returns:
+            AgentConfig with every session setting resolved
+        """
+        # Raw config is passed directly to the plugin factory, which falls
+        # back to its defaults for missing keys
+        cfg = raw_config or {}
+        return cls(
+            ctx=ctx,
+            stt_config=cfg,
+            tts_config=cfg,
+            llm_config=cfg,
+            instructions=ConfigProcessor.prepare_instructions(cfg),
+            welcome_message=cfg.get(
+                "static_message", "Hello! How can I help you today?"),
+            welcome_type=cfg.get("welcome_message_type", "human_initiates"),
+            end_call_on_silence=cfg.get("end_call_on_silence", False),
+            silence_duration=cfg.get("silence_duration", 60),
+            max_call_duration=cfg.get("max_call_duration", 1800),
+            tools=ConfigProcessor.prepare_tool_configs(cfg.get("tools", {})),
+            vad_control=cfg.get(
+                "voice_activity_detection_control",
+                default_min_silence_duration())
+        )
 
 
 async def create_assistant_with_config(
@@ -45,8 +84,8 @@ async def create_assistant_with_config(
 
     This function:
     1. Determines call type and config ID from participant
-    2. Fetches agent configuration from API
-    3. Checks opt_out_sensitive_data for recording decision
+    2. Fetches agent configuration from API while starting call recording
+    3. Checks opt_out_sensitive_data and drops the recording if opted out
     4. Creates AgentConfig with API data or defaults
     5. Instantiates and returns Assistant with proper configuration
 
@@ -60,35 +99,33 @@ async def create_assistant_with_config(
         Assistant: Fully configured Assistant instance
     """
     # Import here to avoid circular dependency
-    from agent import Assistant
-
-    logger.info(f"Creating assistant with configuration for room: {room_name}")
+    from agent import (
+        Assistant,
+        bvc_noise_cancellation,
+        bvc_telephony_noise_cancellation,
+    )
 
     # Determine call type and config ID based on participant
     if participant.kind == rtc.ParticipantKind.PARTICIPANT_KIND_SIP:
         config_id = extract_agent_conf_id(room_name)
-        logger.info(f"SIP call detected - config ID: {config_id}")
 
         # Check for direction or call_type in participant context
         # Prefer 'direction' field, but fall back to 'call_type' if present
         if "direction" in participant_context:
             call_type = participant_context["direction"]
-            logger.info(
-                f"Using direction from participant context: {call_type}")
+            direction_source = "direction"
         elif "call_type" in participant_context:
             call_type = participant_context["call_type"]
             participant_context["direction"] = call_type
-            logger.info(
-                f"Using call_type from participant context: {call_type}")
+            direction_source = "call_type"
         else:
             call_type = "inbound"
             participant_context["direction"] = "inbound"
-            logger.info(
-                "No direction or call_type in participant context, defaulting to inbound")
+            direction_source = "default"
     else:
         call_type = "web"
         config_id = participant.identity
-        logger.info(f"Web call detected - config ID: {config_id}")
+        direction_source = "web"
         # For web calls, also set direction if not present
         if "direction" not in participant_context:
             participant_context["direction"] = "inbound"
@@ -96,87 +133,63 @@ async def create_assistant_with_config(
     # Add call type to participant context for backward compatibility
     participant_context["call_type"] = call_type
 
-    # Fetch configuration from API
-    try:
-        raw_config = await get_agent_config_from_room(room_name, participant_context)
-        logger.info(f"Configuration fetched from API: {bool(raw_config)}")
-    except Exception as e:
-        logger.error(f"Error fetching configuration from API: {str(e)}")
-        raw_config = {}
+    # One record per call instead of one per routing decision
+    logger.info("Creating assistant for room %s: call_type=%s (from %s), config_id=%s",
+                room_name, call_type, direction_source, config_id)
 
-    # Determine if recording should be enabled based on opt_out setting
-    opt_out_recording = raw_config.get("opt_out_sensitive_data", False)
-    session_id = None
+    # Recording can start while the configuration is still being fetched
+    # unless the opt-out setting is already known locally; the hint only
+    # decides whether to start it early
+    opt_out_hint = quick_opt_out_check(config_id, room_name, participant_context)
 
-    if not opt_out_recording:
+    async def fetch_config() -> Dict[str, Any]:
+        try:
+            raw_config = await get_agent_config_from_room(room_name, participant_context)
+            logger.debug("Configuration fetched from API: %s", bool(raw_config))
+            return raw_config
+        except Exception as e:
+            logger.error("Error fetching configuration from API: %s", e)
+            return {}
+
+    async def start_recording() -> Optional[str]:
+        if opt_out_hint:
+            return None
         try:
             session_id = await start_call_recording(
                 phone_number=config_id,
                 room_name=room_name,
                 call_type=call_type
             )
-            logger.info(f"Call recording initialized: {session_id}")
+            logger.debug("Call recording initialized: %s", session_id)
+            return session_id
         except Exception as e:
-            logger.error(f"Error starting call recording: {str(e)}")
+            logger.error("Error starting call recording: %s", e)
+            return None
+
+    # A failure or cancellation in one cancels the other
+    async with asyncio.TaskGroup() as tg:
+        config_task = tg.create_task(fetch_config())
+        recording_task = tg.create_task(start_recording())
+    raw_config, session_id = config_task.result(), recording_task.result()
+
+    # The fetched config has the final say on opt-out; a recording started
+    # speculatively is dropped without being sent
+    opt_out_recording = bool(opt_out_hint) or raw_config.get(
+        "opt_out_sensitive_data", False)
+
+    if opt_out_recording:
+        if session_id:
+            discard_call_recording(session_id)
             session_id = None
-    else:
         logger.info("Call recording disabled due to compliance settings")
 
-    # Extract VAD control from raw config
-    voice_activity_detection_control = raw_config.get(
-        'voice_activity_detection_control', 0.20) if raw_config else 0.20
-
     # Create AgentConfig from raw config or use defaults
-    # Pass raw config directly to plugin factory
-    from utils.config_processor import ConfigProcessor
-
-    if raw_config:
-        agent_config = AgentConfig(
-            ctx=ctx,
-            stt_config=raw_config,  # Pass raw config to plugin factory
-            tts_config=raw_config,  # Pass raw config to plugin factory
-            llm_config=raw_config,  # Pass raw config to plugin factory
-            instructions=raw_config.get(
-                "assistant_instruction",
-                "You are a helpful voice AI assistant."
-            ),
-            welcome_message=raw_config.get(
-                "static_message",
-                "Hello! How can I help you today?"
-            ),
-            welcome_type=raw_config.get(
-                "welcome_message_type",
-                "human_initiates"
-            ),
-            end_call_on_silence=raw_config.get("end_call_on_silence", False),
-            silence_duration=raw_config.get("silence_duration", 60),
-            max_call_duration=raw_config.get("max_call_duration", 1800),
-            tools=ConfigProcessor.prepare_tool_configs(
-                raw_config.get("tools", {}))
-        )
-        logger.info("AgentConfig created from API configuration")
-    else:
-        # Use default configuration with empty dict (plugin factory will use defaults)
-        agent_config = AgentConfig(
-            ctx=ctx,
-            stt_config={},  # Plugin factory will use defaults
-            tts_config={},  # Plugin factory will use defaults
-            llm_config={},  # Plugin factory will use defaults
-            instructions="You are a helpful voice AI assistant.",
-            welcome_message="Hello! How can I help you today?",
-            welcome_type="human_initiates",
-            end_call_on_silence=False,
-            silence_duration=60,
-            max_call_duration=1800,
-            tools=ConfigProcessor.prepare_tool_configs({})
-        )
-        logger.info(
-            "AgentConfig created with default values (API returned no config)")
+    agent_config = AgentConfig.from_raw(ctx, raw_config)
 
     # Configure audio processor based on participant type
-    audio_processor = (noise_cancellation.BVCTelephony()
+    audio_processor = (bvc_telephony_noise_cancellation()
                        if participant.kind == rtc.ParticipantKind.PARTICIPANT_KIND_SIP
-                       else noise_cancellation.BVC())
+                       else bvc_noise_cancellation())
 
     # Create Assistant instance with pre-loaded configuration
     assistant = Assistant(
@@ -191,8 +204,8 @@ async def create_assistant_with_config(
     assistant._room_name = room_name
     assistant._participant_context = participant_context
     assistant._audio_processor = audio_processor
-    assistant._voice_activity_detection_control = voice_activity_detection_control
 
-    logger.info(
-        f"Assistant created successfully with config-driven instructions")
+    logger.info("Assistant created for session %s (%s configuration, recording %s)",
+                session_id, "API" if raw_config else "default",
+                "enabled" if session_id else "disabled")
     return assistant
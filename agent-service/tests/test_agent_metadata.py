@@ -0,0 +1,51 @@
+"""
+Test participant metadata parsing helpers
+"""
+
+import unittest
+from agent import _parse_metadata_str, _try_json
+
+
+class TestTryJson(unittest.TestCase):
+    def test_non_json_string(self):
+        # SIP identities and other plain strings are not parsed
+        self.assertIsNone(_try_json("sip_+33644644937"))
+        self.assertIsNone(_try_json("   "))
+        self.assertIsNone(_try_json(""))
+
+        # Strings that only look like JSON are rejected
+        self.assertIsNone(_try_json("{not json"))
+
+    def test_nested_json(self):
+        self.assertEqual(
+            {"conf_id": "abc", "caller": {"name": "Ada", "tags": ["vip"]}},
+            _try_json(' {"conf_id": "abc", "caller": {"name": "Ada", "tags": ["vip"]}} ')
+        )
+        self.assertEqual([1, {"a": None}], _try_json('[1, {"a": null}]'))
+
+    def test_non_string_input(self):
+        self.assertIsNone(_try_json(None))
+        self.assertIsNone(_try_json(b'{"conf_id": "abc"}'))
+        self.assertIsNone(_try_json({"conf_id": "abc"}))
+        self.assertIsNone(_try_json(42))
+
+
+class TestParseMetadataStr(unittest.TestCase):
+    def test_nested_values_are_not_shared(self):
+        metadata = '{"direction": "inbound", "caller": {"tags": ["vip"]}}'
+
+        first = _parse_metadata_str(metadata)
+        first["direction"] = "outbound"
+        first["caller"]["tags"].append("changed")
+
+        self.assertEqual(
+            {"direction": "inbound", "caller": {"tags": ["vip"]}},
+            _parse_metadata_str(metadata)
+        )
+
+    def test_non_object_metadata(self):
+        self.assertEqual({}, _parse_metadata_str("[1, 2]"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,14 +5,88 @@ and sending call history data to the call history endpoint
 """
 
 import asyncio
+import logging
 import aiohttp
-import json
+import orjson
 from typing import Dict, Any, Optional, List
 import os
 import jwt
 import re
 
 
+logger = logging.getLogger(__name__)
+
+# Keep-alive for pooled connections, so requests made during a call reuse the
+# TLS connection opened by the first one
+KEEPALIVE_TIMEOUT_SECONDS = 300
+
+
+def _json_dumps(obj: Any) -> str:
+    """orjson-backed serializer for aiohttp request bodies"""
+    # Non-str keys are stringified, as json.dumps does
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Shared sessions, created on first use in the running event loop. A session
+# is bound to the loop that created it, so each is stored with its loop and
+# recreated when used from another one (a later job or test)
+_api_session: Optional[aiohttp.ClientSession] = None
+_api_session_loop: Optional[asyncio.AbstractEventLoop] = None
+_http_session: Optional[aiohttp.ClientSession] = None
+_http_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _is_usable(session: Optional[aiohttp.ClientSession],
+               loop: Optional[asyncio.AbstractEventLoop]) -> bool:
+    """Whether a shared session is open and bound to the running loop"""
+    return (session is not None and not session.closed
+            and loop is asyncio.get_running_loop())
+
+
+def _get_api_session() -> aiohttp.ClientSession:
+    """Shared session for the Voice Config API"""
+    global _api_session, _api_session_loop
+    if not _is_usable(_api_session, _api_session_loop):
+        logger.debug("Creating shared aiohttp.ClientSession for the config API")
+        _api_session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30),
+            json_serialize=_json_dumps,
+            # Disable SSL verification for testing
+            connector=aiohttp.TCPConnector(
+                ssl=False, keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS)
+        )
+        _api_session_loop = asyncio.get_running_loop()
+    return _api_session
+
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """Shared session for the call history and tools APIs"""
+    global _http_session, _http_session_loop
+    if not _is_usable(_http_session, _http_session_loop):
+        _http_session = aiohttp.ClientSession(
+            json_serialize=_json_dumps,
+            connector=aiohttp.TCPConnector(
+                keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS)
+        )
+        _http_session_loop = asyncio.get_running_loop()
+    return _http_session
+
+
+async def close_shared_sessions() -> None:
+    """Close the shared HTTP sessions (call on shutdown)
+
+    Sessions created on another event loop cannot be closed from this one
+    and are only dropped.
+    """
+    global _api_session, _api_session_loop, _http_session, _http_session_loop
+    for session, loop in ((_api_session, _api_session_loop),
+                          (_http_session, _http_session_loop)):
+        if _is_usable(session, loop):
+            await session.close()
+    _api_session = _api_session_loop = None
+    _http_session = _http_session_loop = None
+
+
 class APIClient:
     """Client for making external API calls to the Voice Config API"""
 
@@ -25,20 +99,12 @@ class APIClient:
 
     async def __aenter__(self):
         """Async context manager entry"""
-        print("DEBUG: Creating new aiohttp.ClientSession with base headers:",
-              self.base_headers)
-        self.session = aiohttp.ClientSession(
-            headers=self.base_headers,
-            timeout=aiohttp.ClientTimeout(total=30),
-            # Disable SSL verification for testing
-            connector=aiohttp.TCPConnector(ssl=False)
-        )
+        self.session = _get_api_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit; the shared session stays open"""
+        self.session = None
 
     async def _make_request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
         """Make HTTP request with error handling"""
@@ -49,14 +115,17 @@ class APIClient:
         # Ensure HTTPS protocol is used
         url = ensure_https_url(url)
 
+        # Base headers were session defaults before sessions were shared
+        kwargs["headers"] = {**self.base_headers, **(kwargs.get("headers") or {})}
+
         try:
             async with self.session.request(method, url, **kwargs) as response:
                 response_text = await response.text()
-                print(f"DEBUG: Response status code: {response.status}")
-                print(f"DEBUG: Response headers: {dict(response.headers)}")
+                logger.debug("Response status code: %s, headers: %s",
+                             response.status, response.headers)
 
                 if response.status >= 400:
-                    print(f"API Error {response.status}: {response_text}")
+                    logger.error("API Error %s: %s", response.status, response_text)
                     return {
                         "error": True,
                         "status_code": response.status,
@@ -64,8 +133,8 @@ class APIClient:
                     }
 
                 try:
-                    return await response.json()
-                except json.JSONDecodeError:
+                    return await response.json(loads=orjson.loads)
+                except orjson.JSONDecodeError:
                     return {"data": response_text, "raw": True}
 
         except asyncio.TimeoutError:
@@ -112,11 +181,10 @@ class APIClient:
                 # Only pass params if we have any
                 params = params if params else None
 
-                print(
-                    f"Fetching agent config by token for: {phone_number} (call_type={call_type or 'n/a'}, room_name={room_name or 'n/a'})")
-                print(f"DEBUG: Request URL: {token_url}")
-                print(f"DEBUG: Request headers: {headers}")
-                print(f"DEBUG: Request params: {params}")
+                logger.info("Fetching agent config by token for: %s (call_type=%s, room_name=%s)",
+                            phone_number, call_type or 'n/a', room_name or 'n/a')
+                logger.debug("Request URL: %s, headers: %s, params: %s",
+                             token_url, headers, params)
                 result = await self._make_request(
                     "GET", token_url, headers=headers, params=params)
 
@@ -124,10 +192,10 @@ class APIClient:
                     # Some APIs wrap results in { config: {...} } or { data: {...} }
                     return result.get("config") or result.get("data") or result
                 else:
-                    print(
-                        f"Failed to fetch token-based config for {phone_number}: {result.get('message')}")
+                    logger.error("Failed to fetch token-based config for %s: %s",
+                                 phone_number, result.get('message'))
             except Exception as e:
-                print(f"Token-based config fetch failed: {e}")
+                logger.error("Token-based config fetch failed: %s", e)
 
         return None
 
@@ -195,7 +263,7 @@ async def send_call_history(call_data: Dict[str, Any]) -> Dict[str, Any]:
     endpoint = os.getenv("CALL_HISTORY_ENDPOINT")
 
     if not endpoint:
-        print("Error: CALL_HISTORY_ENDPOINT environment variable not set")
+        logger.error("CALL_HISTORY_ENDPOINT environment variable not set")
         return {"error": True, "message": "CALL_HISTORY_ENDPOINT not configured"}
 
     # Ensure the URL uses HTTPS protocol
@@ -220,28 +288,28 @@ async def send_call_history(call_data: Dict[str, Any]) -> Dict[str, Any]:
 
             headers["Authorization"] = f"Bearer {token}"
         except Exception as e:
-            print(f"Failed to create JWT for call history: {e}")
+            logger.error("Failed to create JWT for call history: %s", e)
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(endpoint, json=call_data, headers=headers) as response:
-                if response.status >= 400:
-                    error_text = await response.text()
-                    print(
-                        f"Call history API error {response.status}: {error_text}")
-                    return {
-                        "error": True,
-                        "status_code": response.status,
-                        "message": error_text
-                    }
+        session = _get_http_session()
+        async with session.post(endpoint, json=call_data, headers=headers) as response:
+            if response.status >= 400:
+                error_text = await response.text()
+                logger.error("Call history API error %s: %s",
+                             response.status, error_text)
+                return {
+                    "error": True,
+                    "status_code": response.status,
+                    "message": error_text
+                }
 
-                try:
-                    return await response.json()
-                except json.JSONDecodeError:
-                    response_text = await response.text()
-                    return {"success": True, "data": response_text}
+            try:
+                return await response.json(loads=orjson.loads)
+            except orjson.JSONDecodeError:
+                response_text = await response.text()
+                return {"success": True, "data": response_text}
     except Exception as e:
-        print(f"Error sending call history data: {e}")
+        logger.error("Error sending call history data: %s", e)
         return {"error": True, "message": str(e)}
 
 
@@ -258,15 +326,15 @@ async def get_tools_schema(tool_ids: List[str], workspace_id: str) -> Dict[str,
 
     endpoint = f"{tools_api_url}/tools/schema"
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(endpoint, params={"tool_ids": tool_ids, "workspace_id": workspace_id}) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    error_text = await response.text()
-                    print(
-                        f"Failed to fetch tools schema: {response.status} - {error_text}")
-                    return {"error": True, "status_code": response.status, "message": error_text}
+        session = _get_http_session()
+        async with session.get(endpoint, params={"tool_ids": tool_ids, "workspace_id": workspace_id}) as response:
+            if response.status == 200:
+                return await response.json(loads=orjson.loads)
+            else:
+                error_text = await response.text()
+                logger.error("Failed to fetch tools schema: %s - %s",
+                             response.status, error_text)
+                return {"error": True, "status_code": response.status, "message": error_text}
     except Exception as e:
-        print(f"Error fetching tools schema: {e}")
+        logger.error("Error fetching tools schema: %s", e)
         return {"error": True, "message": str(e)}
@@ -211,7 +211,7 @@ async def start_call_recording(phone_number: str, room_name: str,
     # Save to storage
     await _save_call_record(call_record.to_dict())
 
-    logger.info(f"Started recording call {call_id} for {phone_number}")
+    logger.info("Started recording call %s for %s", call_id, phone_number)
     return call_id
 
 
@@ -228,7 +228,7 @@ async def update_call_config(call_id: str, agent_config: Dict[str, Any]) -> bool
     """
     # Check if call is in active calls
     if call_id not in active_calls:
-        logger.warning(f"Call {call_id} not found in active calls")
+        logger.warning("Call %s not found in active calls", call_id)
         return False
 
     # Update the call record
@@ -251,9 +251,13 @@ async def update_call_stage(call_id: str, stage: str) -> bool:
     """
     # Check if call is in active calls
     if call_id not in active_calls:
-        logger.warning(f"Call {call_id} not found in active calls")
+        logger.warning("Call %s not found in active calls", call_id)
         return False
 
+    # Coalesce repeats of the stage the call is already in
+    if active_calls[call_id].outcomes.get("final_stage") == stage:
+        return True
+
     # Update the call record
     active_calls[call_id].update_stage(stage)
 
@@ -261,6 +265,25 @@ async def update_call_stage(call_id: str, stage: str) -> bool:
     return await _save_call_record(active_calls[call_id].to_dict())
 
 
+def discard_call_recording(call_id: str) -> bool:
+    """
+    Drop an active call record without sending it to the API
+
+    Used when a recording was started before the configuration showed the
+    call opts out of recording.
+
+    Args:
+        call_id: The ID of the call to drop
+
+    Returns:
+        bool: True if a record was dropped, False if it was not active
+    """
+    if active_calls.pop(call_id, None) is None:
+        return False
+    logger.info("Discarded call recording %s", call_id)
+    return True
+
+
 # NOTE: Metrics update functionality has been removed from this agent service.
 # It should be implemented on the call history service that receives call data.
 # See documentation below for implementation details.
@@ -283,7 +306,7 @@ async def end_call_recording(call_id: str, status: str = "completed",
     """
     # Check if call is in active calls
     if call_id not in active_calls:
-        logger.warning(f"Call {call_id} not found in active calls")
+        logger.warning("Call %s not found in active calls", call_id)
         return False
 
     # Update the call record
@@ -300,15 +323,16 @@ async def end_call_recording(call_id: str, status: str = "completed",
 
     if response.get("error"):
         logger.error(
-            f"Failed to send call history data: {response.get('message')}")
+            "Failed to send call history data: %s", response.get('message'))
         success = False
     else:
-        logger.info(f"Successfully sent call history data to API endpoint")
+        logger.info("Successfully sent call history data to API endpoint")
         success = True
 
     if success:
         logger.info(
-            f"Ended call {call_id} with status {status}, duration: {call_record.duration_seconds}s")
+            "Ended call %s with status %s, duration: %ss",
+            call_id, status, call_record.duration_seconds)
 
     return success
 
@@ -2,9 +2,12 @@
 Utility to extract phone numbers from room names and fetch configuration from API
 """
 
+import asyncio
+import functools
 import logging
 import os
 import re
+import time
 import jwt
 import json
 from typing import Dict, Any, Optional, Tuple
@@ -12,6 +15,27 @@ from utils.api_client import APIClient
 
 logger = logging.getLogger(__name__)
 
+# Fetched configurations are cached per process so repeated calls to the same
+# number / configuration skip the remote round-trip. Room names carry a per-call
+# suffix, so the key is the identity the API resolves on (phone number or
+# conf_id) plus the call direction.
+CONFIG_CACHE_TTL_SECONDS = float(os.getenv("AGENT_CONFIG_CACHE_TTL", "60"))
+# Upper bound on cached configurations; the least recently used entry is
+# evicted first
+CONFIG_CACHE_MAX_ENTRIES = int(os.getenv("AGENT_CONFIG_CACHE_SIZE", "1024"))
+
+ConfigCacheKey = Tuple[str, str, Optional[str]]
+
+# key -> (expiry on the monotonic clock, config, detected direction)
+_config_cache: Dict[ConfigCacheKey, Tuple[float, Dict[str, Any], Optional[str]]] = {}
+_config_cache_locks: Dict[ConfigCacheKey, asyncio.Lock] = {}
+# Callers holding or waiting on each key's lock; a lock is only dropped once
+# it has none, so concurrent lookups never end up on different locks
+_config_cache_lock_users: Dict[ConfigCacheKey, int] = {}
+
+# Phone numbers in room names of the form: twilio-+12345678901-XXXXX
+_ROOM_PHONE_RE = re.compile(r'twilio-(\+?\d+)-')
+
 async def extract_phone_from_room_name(room_name: str) -> Optional[str]:
     """
     Extract a phone number from a LiveKit room name
@@ -25,9 +49,7 @@ async def extract_phone_from_room_name(room_name: str) -> Optional[str]:
     if not room_name:
         return None
 
-    # Pattern to match phone numbers in format: twilio-+12345678901-XXXXX
-    pattern = r'twilio-(\+?\d+)-'
-    match = re.search(pattern, room_name)
+    match = _ROOM_PHONE_RE.search(room_name)
 
     if match:
         return match.group(1)
@@ -95,14 +117,15 @@ async def fetch_agent_config_by_phone(phone_number: str, call_direction: Optiona
         params = params if params else None
 
         logger.info(
-            f"Fetching agent config for phone: {phone_number}, direction: {call_direction or 'inbound'}, room: {room_name or 'n/a'}, url: {config_url}, params: {params}")
+            "Fetching agent config for phone: %s, direction: %s, room: %s, url: %s, params: %s",
+            phone_number, call_direction or 'inbound', room_name or 'n/a', config_url, params)
         result = await client._make_request("GET", config_url, headers=headers, params=params)
-        logger.info(f"API Response: {result}")
+        logger.debug("API Response: %s", result)
 
         if result.get("error") or result.get("responseCode") != "00":
             error_message = result.get("message") or result.get(
                 "description") or "Unknown error"
-            logger.info(f"Error fetching configuration: {error_message}")
+            logger.info("Error fetching configuration: %s", error_message)
             return {}, None
 
         # Extract the config from the data field
@@ -110,19 +133,19 @@ async def fetch_agent_config_by_phone(phone_number: str, call_direction: Optiona
 
         # For web calls with conf_id, the config is flat in data
         if conf_id and data:
-            logger.info(f"Using web call configuration (conf_id: {conf_id})")
+            logger.info("Using web call configuration (conf_id: %s)", conf_id)
             return data, call_direction
 
         # For telephony calls, extract from nested phone_number structure
         phone_data = data.get("phone_number", {})
 
         if not phone_data:
-            logger.info(f"No configuration found for phone number: {phone_number}")
+            logger.info("No configuration found for phone number: %s", phone_number)
             return {}, None
 
         # If direction is provided, use it to get the specific config
         if call_direction and call_direction in phone_data:
-            logger.info(f"Using {call_direction} configuration")
+            logger.info("Using %s configuration", call_direction)
             return phone_data[call_direction], call_direction
 
         # If not provided, try to determine from available keys
@@ -133,10 +156,144 @@ async def fetch_agent_config_by_phone(phone_number: str, call_direction: Optiona
             logger.info("Using outbound configuration")
             return phone_data["outbound"], "outbound"
 
-        logger.info(f"No valid configuration found for phone: {phone_number}")
+        logger.info("No valid configuration found for phone: %s", phone_number)
         return {}, None
 
 
+def _store_cached_config(key: ConfigCacheKey, entry: Tuple[float, Dict[str, Any], Optional[str]]) -> None:
+    """Insert a cache entry as most recently used, evicting the oldest entries
+    once the cache is over CONFIG_CACHE_MAX_ENTRIES"""
+    _config_cache.pop(key, None)
+    _config_cache[key] = entry
+    while len(_config_cache) > CONFIG_CACHE_MAX_ENTRIES:
+        oldest = next(iter(_config_cache))
+        del _config_cache[oldest]
+        if oldest not in _config_cache_lock_users:
+            _config_cache_locks.pop(oldest, None)
+
+
+def clear_agent_config_cache() -> None:
+    """Drop all cached agent configurations"""
+    _config_cache.clear()
+    _config_cache_locks.clear()
+    _config_cache_lock_users.clear()
+
+
+@functools.cache
+def _opt_out_config_ids() -> frozenset:
+    """Configuration IDs / numbers listed in OPT_OUT_CONFIG_IDS (comma separated)"""
+    raw = os.getenv("OPT_OUT_CONFIG_IDS", "")
+    return frozenset(item.strip().lstrip("+") for item in raw.split(",") if item.strip())
+
+
+def _config_cache_key(phone_number: str, call_direction: Optional[str] = None, conf_id: Optional[str] = None) -> ConfigCacheKey:
+    """Cache key for a lookup: the identity the API resolves on (conf_id or
+    phone number) and the call direction"""
+    return ("conf_id" if conf_id else "phone", conf_id or phone_number, call_direction)
+
+
+def _telephony_direction(participant_metadata: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Call direction for a telephony lookup; defaults to inbound once
+    metadata is present"""
+    if participant_metadata and isinstance(participant_metadata, dict):
+        return participant_metadata.get("direction") or "inbound"
+    return None
+
+
+def _room_config_cache_key(room_name: str, participant_metadata: Optional[Dict[str, Any]]) -> Optional[ConfigCacheKey]:
+    """Cache key get_agent_config_from_room looks up for a room, or None if
+    the room cannot be resolved to a configuration"""
+    match = _ROOM_PHONE_RE.search(room_name) if room_name else None
+    if match:
+        return _config_cache_key(match.group(1), _telephony_direction(participant_metadata))
+    if isinstance(participant_metadata, dict) and participant_metadata.get("conf_id"):
+        return _config_cache_key("unknown", participant_metadata.get("direction"),
+                                 participant_metadata["conf_id"])
+    return None
+
+
+def quick_opt_out_check(config_id: Optional[str], room_name: str, participant_metadata: Optional[Dict[str, Any]] = None) -> Optional[bool]:
+    """
+    Determine whether a configuration opts out of recording without fetching it
+
+    Checks the OPT_OUT_CONFIG_IDS environment list, then the live cached
+    configuration get_agent_config_from_room would return for the same room
+    and metadata (same number / conf_id and call direction).
+
+    Args:
+        config_id: Phone number or configuration ID for the call
+        room_name: The LiveKit room name
+        participant_metadata: Metadata with the call direction / conf_id, as
+            passed to get_agent_config_from_room
+
+    Returns:
+        True/False if the opt-out setting is known locally, None if the
+        configuration has to be fetched to find out
+    """
+    if config_id and config_id.lstrip("+") in _opt_out_config_ids():
+        return True
+
+    key = _room_config_cache_key(room_name, participant_metadata)
+    cached = _config_cache.get(key) if key else None
+    if cached and cached[0] > time.monotonic():
+        return bool(cached[1].get("opt_out_sensitive_data", False))
+    return None
+
+
+async def fetch_agent_config_cached(phone_number: str, call_direction: Optional[str] = None, room_name: Optional[str] = None, conf_id: Optional[str] = None, bypass_cache: bool = False) -> Tuple[Dict[str, Any], Optional[str]]:
+    """
+    Fetch agent configuration through the in-process TTL cache
+
+    Concurrent lookups for the same key share a single fetch. Only successful
+    (non-empty) configurations are cached.
+
+    Args:
+        phone_number: The phone number to get configuration for
+        call_direction: The call direction ("inbound" or "outbound") if known
+        room_name: Optional room name for the call
+        conf_id: Optional configuration ID (web calls)
+        bypass_cache: Skip the cache lookup and force a fresh fetch
+
+    Returns:
+        Tuple of (agent_config, extracted_direction), as fetch_agent_config_by_phone
+    """
+    if CONFIG_CACHE_TTL_SECONDS <= 0:
+        return await fetch_agent_config_by_phone(phone_number, call_direction, room_name, conf_id)
+
+    key = _config_cache_key(phone_number, call_direction, conf_id)
+    lock = _config_cache_locks.setdefault(key, asyncio.Lock())
+    _config_cache_lock_users[key] = _config_cache_lock_users.get(key, 0) + 1
+
+    try:
+        async with lock:
+            if not bypass_cache:
+                cached = _config_cache.get(key)
+                if cached and cached[0] > time.monotonic():
+                    logger.info("Using cached agent config for: %s", key[1])
+                    _store_cached_config(key, cached)
+                    return cached[1], cached[2]
+
+            config, detected_direction = await fetch_agent_config_by_phone(
+                phone_number, call_direction, room_name, conf_id)
+
+            if config:
+                _store_cached_config(key, (
+                    time.monotonic() + CONFIG_CACHE_TTL_SECONDS, config, detected_direction))
+            else:
+                _config_cache.pop(key, None)
+
+            return config, detected_direction
+    finally:
+        # Once no caller uses it, the lock is kept only for a cached key, so
+        # failed lookups across a phone-number keyspace do not accumulate;
+        # evicted keys drop theirs in _store_cached_config
+        users = _config_cache_lock_users.pop(key, 1) - 1
+        if users:
+            _config_cache_lock_users[key] = users
+        elif key not in _config_cache:
+            _config_cache_locks.pop(key, None)
+
+
 async def get_agent_config_from_room(room_name: str, participant_metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Get agent configuration from room name and participant metadata
@@ -149,55 +306,59 @@ async def get_agent_config_from_room(room_name: str, participant_metadata: Optio
         Agent configuration dictionary
     """
     phone_number = await extract_phone_from_room_name(room_name)
+    bypass_cache = bool(
+        participant_metadata and isinstance(participant_metadata, dict)
+        and participant_metadata.get("refresh_config"))
 
     if not phone_number:
-        logger.info(f"Could not extract phone number from room name: {room_name}")
+        logger.info("Could not extract phone number from room name: %s", room_name)
         # Check for conf_id in participant_metadata
         if participant_metadata and isinstance(participant_metadata, dict):
             conf_id = participant_metadata.get("conf_id")
             direction = participant_metadata.get("direction")
             if conf_id:
                 logger.info(
-                    f"Found conf_id in metadata: {conf_id}, using it to fetch config")
+                    "Found conf_id in metadata: %s, using it to fetch config", conf_id)
                 try:
                     # Use a default phone number since it's required for JWT
-                    config, detected_direction = await fetch_agent_config_by_phone(
+                    config, detected_direction = await fetch_agent_config_cached(
                         phone_number="unknown",
                         call_direction=direction,
                         room_name=room_name,
-                        conf_id=conf_id
+                        conf_id=conf_id,
+                        bypass_cache=bypass_cache
                     )
                     return config
                 except Exception as e:
-                    logger.info(f"Error getting agent config with conf_id: {e}")
+                    logger.info("Error getting agent config with conf_id: %s", e)
         return {}
 
     # Extract call direction from metadata if available
-    call_direction = None
-    if participant_metadata and isinstance(participant_metadata, dict):
-        call_direction = participant_metadata.get("direction")
-        if call_direction:
-            logger.info(f"Using call direction from metadata: {call_direction}")
+    call_direction = _telephony_direction(participant_metadata)
+    if call_direction:
+        if participant_metadata.get("direction"):
+            logger.info("Using call direction from metadata: %s", call_direction)
         else:
             logger.info("No call direction found in metadata, defaulting to inbound")
-            call_direction = "inbound"
 
     try:
-        config, detected_direction = await fetch_agent_config_by_phone(phone_number, call_direction, room_name)
+        config, detected_direction = await fetch_agent_config_cached(
+            phone_number, call_direction, room_name, bypass_cache=bypass_cache)
 
         if detected_direction and call_direction and detected_direction != call_direction:
             logger.info(
-                f"Warning: Detected direction ({detected_direction}) differs from metadata direction ({call_direction})")
+                "Warning: Detected direction (%s) differs from metadata direction (%s)", detected_direction, call_direction)
 
         if config:
             # Log the configuration keys we've received to help with debugging
-            config_keys = list(config.keys())
-            logger.info(f"Received configuration with keys: {config_keys}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Received configuration with keys: %s",
+                            list(config.keys()))
             return config
         else:
             logger.info(
-                f"No configuration found for phone: {phone_number}, direction: {call_direction}")
+                "No configuration found for phone: %s, direction: %s", phone_number, call_direction)
             return {}
     except Exception as e:
-        logger.info(f"Error getting agent config: {e}")
+        logger.info("Error getting agent config: %s", e)
         return {}
@@ -7,20 +7,28 @@ data into structured configuration objects for STT, TTS, LLM, and tools.
 
 from typing import Dict, Any
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from typing import Optional
 import logging
+import os
+import unicodedata
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolConfig:
-    """Data class to hold tool configuration"""
+    """Immutable data class to hold tool configuration"""
     enabled: bool
     url: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
 
+
+# Shared configuration for every disabled tool
+_DISABLED_TOOL = ToolConfig(enabled=False)
+
+
 class ToolType(Enum):
     """Enumeration of tool types"""
     QUERY = "query"
@@ -28,6 +36,42 @@ class ToolType(Enum):
     SEND_TEXT = "send_text"
     GOOGLE_CALENDAR = "google_calendar"
 
+
+DEFAULT_INSTRUCTIONS = "You are a helpful voice AI assistant."
+
+
+# Used when VAD_MIN_SILENCE_MS is unset or invalid
+DEFAULT_MIN_SILENCE_MS = 200.0
+
+
+@cache
+def default_min_silence_duration() -> float:
+    """Silence duration, in seconds, used when the agent configuration sets
+    none; the worker's VAD is prewarmed with it (VAD_MIN_SILENCE_MS, default 200)
+    """
+    raw = os.getenv("VAD_MIN_SILENCE_MS")
+    if raw is None:
+        return DEFAULT_MIN_SILENCE_MS / 1000
+    try:
+        silence_ms = float(raw)
+    except ValueError:
+        silence_ms = None
+    # Also rejects negative and NaN values
+    if silence_ms is None or not silence_ms >= 0:
+        logger.warning("Invalid VAD_MIN_SILENCE_MS %r, using %s ms",
+                       raw, DEFAULT_MIN_SILENCE_MS)
+        silence_ms = DEFAULT_MIN_SILENCE_MS
+    return silence_ms / 1000
+
+
+@lru_cache(maxsize=64)
+def _canonical_text(text: str) -> str:
+    """NFC-normalize text and strip BOMs, CRLFs and surrounding whitespace, so
+    the same configured prompt is byte-identical on every call"""
+    text = unicodedata.normalize("NFC", text.replace("\ufeff", ""))
+    return text.replace("\r\n", "\n").strip()
+
+
 class ConfigProcessor:
     """Processes and prepares agent configuration from raw API responses"""
 
@@ -46,7 +90,7 @@ class ConfigProcessor:
             "model": config.get("transcription_provider_model", "nova-2"),
             "language": config.get("agent_language", "en-US")
         }
-        logger.info(f"Using STT provider: {stt_config['provider']}")
+        logger.info("Using STT provider: %s", stt_config['provider'])
         return stt_config
 
     @staticmethod
@@ -70,8 +114,8 @@ class ConfigProcessor:
             "voice_improvement": bool(config.get("voice_improvement", True)),
             "language": config.get("agent_language", "en-US")
         }
-        logger.info(
-            f"Using TTS provider: {tts_config['provider']} with voice: {tts_config['voice']}")
+        logger.info("Using TTS provider: %s with voice: %s",
+                    tts_config['provider'], tts_config['voice'])
         return tts_config
 
     @staticmethod
@@ -90,10 +134,28 @@ class ConfigProcessor:
             "temperature": 0.7  # Default temperature if not specified
         }
 
-        logger.info(
-            f"Using LLM provider: {llm_config['provider']} with model: {llm_config['model']}")
+        logger.info("Using LLM provider: %s with model: %s",
+                    llm_config['provider'], llm_config['model'])
         return llm_config
 
+    @staticmethod
+    def prepare_instructions(config: Dict) -> str:
+        """Prepare the system instructions in canonical form
+
+        Keeping the prompt byte-identical across calls lets the LLM
+        provider reuse its cached prefix.
+
+        Args:
+            config: Raw configuration dictionary from the config service
+
+        Returns:
+            Canonicalized instructions string
+        """
+        instructions = config.get("assistant_instruction", DEFAULT_INSTRUCTIONS)
+        if not isinstance(instructions, str):
+            return instructions
+        return _canonical_text(instructions)
+
     @staticmethod
     def prepare_tool_configs(tools_config: Dict[str, Any]) -> Dict[str, ToolConfig]:
         """
@@ -122,11 +184,8 @@ class ConfigProcessor:
 
             # If it's just a boolean, convert to ToolConfig
             if isinstance(tool_config, bool):
-                result[tool_name] = ToolConfig(
-                    enabled=tool_config,
-                    url=None,
-                    metadata=None
-                )
+                result[tool_name] = (ToolConfig(enabled=True)
+                                     if tool_config else _DISABLED_TOOL)
             # If it's a dictionary, extract the structured data
             elif isinstance(tool_config, dict):
                 result[tool_name] = ToolConfig(
@@ -136,10 +195,6 @@ class ConfigProcessor:
                 )
             # Otherwise, default to disabled
             else:
-                result[tool_name] = ToolConfig(
-                    enabled=False,
-                    url=None,
-                    metadata=None
-                )
+                result[tool_name] = _DISABLED_TOOL
 
         return result
@@ -73,7 +73,7 @@ class ConversationContext:
         self.conversation_history.append({
             "role": role,
             "content": content,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": asyncio.get_running_loop().time()
         })
 
     async def get_next_action_suggestion(self) -> Optional[str]:
@@ -25,12 +25,67 @@ Key functions:
 - log_all_available_data(): Debug function for exploring available data
 """
 
+import functools
 import logging
+import os
 import re
 
+import orjson
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Attributes copied into "additional_attributes" along with every sip_*
+# attribute; metadata is parsed separately
+ROOM_ATTRIBUTE_FIELDS = ("name",)
+REQUEST_ATTRIBUTE_FIELDS = ("room_name", "call_id")
+
+# Patterns compiled once at import; these run on every call
+_CTX_ROOM_NAME_RE = re.compile(r'room_name=([^,)]+)')
+# Twilio format "twilio-+NUMBER-UUID"
+_TWILIO_PHONE_RE = re.compile(r'twilio-\+?([0-9]+)-')
+# Direct phone number in the string
+_PLUS_PHONE_RE = re.compile(r'\+([0-9]+)')
+# Numbers of typical phone length (7-15 digits)
+_DIGITS_PHONE_RE = re.compile(r'[0-9]{7,15}')
+# "sip-trunk123-from+1234567890-to+0987654321"
+_SIP_ROOM_RE = re.compile(
+    r'sip-(?:trunk)?([^-]+)?-?from([^-]+)-to([^-]+)', re.IGNORECASE)
+# "twilio-trunk-abc123-+1234567890"
+_TWILIO_TRUNK_RE = re.compile(r'twilio-trunk-([^-]+)-(.+)', re.IGNORECASE)
+# Trunk IDs in various formats, in priority order
+_TRUNK_ID_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'trunk[_-]?([a-zA-Z0-9]+)',
+    r'trk[_-]?([a-zA-Z0-9]+)',
+    r'sip[_-]?trunk[_-]?([a-zA-Z0-9]+)',
+))
+
+
+@functools.lru_cache(maxsize=32)
+def _class_sip_attributes(cls):
+    """sip_* attribute names defined on a class, scanned once per type"""
+    return tuple(attr for attr in dir(cls) if attr.startswith('sip_'))
+
+
+def _attribute_names(obj, fields):
+    """
+    Names of the attributes to copy from a room or job request
+
+    Args:
+        obj: The object to read attributes from
+        fields: Fixed attribute names to copy
+
+    Returns:
+        The fixed names plus every sip_* attribute on the object's type or
+        set on the instance
+    """
+    names = fields + _class_sip_attributes(type(obj))
+    instance_attrs = getattr(obj, '__dict__', None)
+    if instance_attrs:
+        names += tuple(attr for attr in instance_attrs
+                       if attr.startswith('sip_') and attr not in names)
+    return names
+
 
 def extract_room_name(ctx):
     """
@@ -54,8 +109,7 @@ def extract_room_name(ctx):
         ctx_str = str(ctx)
         if "room_name=" in ctx_str:
             # Handle various patterns with better regex
-            import re
-            match = re.search(r'room_name=([^,)]+)', ctx_str)
+            match = _CTX_ROOM_NAME_RE.search(ctx_str)
             if match:
                 room_name = match.group(1).strip()
                 if room_name and room_name != "None":
@@ -113,20 +167,17 @@ def extract_phone_number(room_name):
 
     # Try to extract using regex patterns
     # Pattern 1: For Twilio format "twilio-+NUMBER-UUID"
-    twilio_pattern = r'twilio-\+?([0-9]+)-'
-    match = re.search(twilio_pattern, room_name)
+    match = _TWILIO_PHONE_RE.search(room_name)
     if match:
         return "+" + match.group(1)
 
     # Pattern 2: Direct phone number in the string
-    phone_pattern = r'\+([0-9]+)'
-    match = re.search(phone_pattern, room_name)
+    match = _PLUS_PHONE_RE.search(room_name)
     if match:
         return "+" + match.group(1)
 
     # Pattern 3: Look for numbers of typical phone length (7-15 digits)
-    numbers_pattern = r'[0-9]{7,15}'
-    match = re.search(numbers_pattern, room_name)
+    match = _DIGITS_PHONE_RE.search(room_name)
     if match:
         number = match.group(0)
         # Add + prefix if it looks like an international number
@@ -172,13 +223,12 @@ def extract_comprehensive_room_data(ctx):
             # Room metadata
             if hasattr(ctx.room, 'metadata') and ctx.room.metadata:
                 try:
-                    import json
                     if isinstance(ctx.room.metadata, str):
-                        room_data["room_metadata"] = json.loads(
+                        room_data["room_metadata"] = orjson.loads(
                             ctx.room.metadata)
                     else:
                         room_data["room_metadata"] = ctx.room.metadata
-                except (json.JSONDecodeError, AttributeError) as e:
+                except (orjson.JSONDecodeError, AttributeError) as e:
                     logger.debug(f"Could not parse room metadata: {e}")
                     room_data["room_metadata"] = {
                         "raw": str(ctx.room.metadata)}
@@ -187,13 +237,12 @@ def extract_comprehensive_room_data(ctx):
             if hasattr(ctx.room, 'local_participant') and ctx.room.local_participant:
                 if hasattr(ctx.room.local_participant, 'metadata') and ctx.room.local_participant.metadata:
                     try:
-                        import json
                         if isinstance(ctx.room.local_participant.metadata, str):
-                            room_data["participant_metadata"] = json.loads(
+                            room_data["participant_metadata"] = orjson.loads(
                                 ctx.room.local_participant.metadata)
                         else:
                             room_data["participant_metadata"] = ctx.room.local_participant.metadata
-                    except (json.JSONDecodeError, AttributeError) as e:
+                    except (orjson.JSONDecodeError, AttributeError) as e:
                         logger.debug(
                             f"Could not parse participant metadata: {e}")
                         room_data["participant_metadata"] = {
@@ -214,18 +263,14 @@ def extract_comprehensive_room_data(ctx):
                         "direction") or metadata.get("call_direction")
 
             # Try to extract from room attributes (avoiding coroutines)
-            room_attrs = dir(ctx.room)
-            for attr in room_attrs:
-                if attr.startswith('sip_') or attr in ['name', 'metadata']:
-                    try:
-                        value = getattr(ctx.room, attr)
-                        # We already handled metadata
-                        if value and attr not in ['metadata']:
-                            room_data["additional_attributes"][attr] = str(
-                                value)
-                    except Exception as e:
-                        logger.debug(
-                            f"Could not access room attribute {attr}: {e}")
+            for attr in _attribute_names(ctx.room, ROOM_ATTRIBUTE_FIELDS):
+                try:
+                    value = getattr(ctx.room, attr, None)
+                    if value:
+                        room_data["additional_attributes"][attr] = str(value)
+                except Exception as e:
+                    logger.debug(
+                        f"Could not access room attribute {attr}: {e}")
 
             # Handle sid separately since it's a coroutine
             try:
@@ -237,17 +282,15 @@ def extract_comprehensive_room_data(ctx):
         # Extract from job request if available
         if hasattr(ctx, 'job') and hasattr(ctx.job, 'request'):
             request = ctx.job.request
-            request_attrs = dir(request)
-            for attr in request_attrs:
-                if attr.startswith('sip_') or attr in ['room_name', 'call_id']:
-                    try:
-                        value = getattr(request, attr)
-                        if value:
-                            room_data["additional_attributes"][f"request_{attr}"] = str(
-                                value)
-                    except Exception as e:
-                        logger.debug(
-                            f"Could not access request attribute {attr}: {e}")
+            for attr in _attribute_names(request, REQUEST_ATTRIBUTE_FIELDS):
+                try:
+                    value = getattr(request, attr, None)
+                    if value:
+                        room_data["additional_attributes"][f"request_{attr}"] = str(
+                            value)
+                except Exception as e:
+                    logger.debug(
+                        f"Could not access request attribute {attr}: {e}")
 
         # Try to extract SIP data from room name patterns
         if room_data["room_name"] and room_data["room_name"] != "unknown":
@@ -267,7 +310,6 @@ def extract_comprehensive_room_data(ctx):
 
         # Fallback: Use environment variables if available
         if not room_data.get("sip_to") or not room_data.get("sip_from"):
-            import os
             env_phone = os.getenv("PHONE_NUMBER")
             if env_phone:
                 logger.debug(
@@ -300,8 +342,7 @@ def extract_sip_data_from_room_name(room_name):
     try:
         # Common SIP room name patterns
         # Pattern 1: "sip-trunk123-from+1234567890-to+0987654321"
-        sip_pattern = r'sip-(?:trunk)?([^-]+)?-?from([^-]+)-to([^-]+)'
-        match = re.search(sip_pattern, room_name, re.IGNORECASE)
+        match = _SIP_ROOM_RE.search(room_name)
         if match:
             trunk_id, sip_from, sip_to = match.groups()
             if trunk_id:
@@ -313,8 +354,7 @@ def extract_sip_data_from_room_name(room_name):
                 sip_data["sip_to"] = sip_to.replace('%2B', '+')
 
         # Pattern 2: "twilio-trunk-abc123-+1234567890"
-        twilio_pattern = r'twilio-trunk-([^-]+)-(.+)'
-        match = re.search(twilio_pattern, room_name, re.IGNORECASE)
+        match = _TWILIO_TRUNK_RE.search(room_name)
         if match:
             trunk_id, number = match.groups()
             sip_data["sip_trunk_id"] = trunk_id
@@ -322,14 +362,8 @@ def extract_sip_data_from_room_name(room_name):
                 '+') else f"+{number}"
 
         # Pattern 3: Look for trunk IDs in various formats
-        trunk_patterns = [
-            r'trunk[_-]?([a-zA-Z0-9]+)',
-            r'trk[_-]?([a-zA-Z0-9]+)',
-            r'sip[_-]?trunk[_-]?([a-zA-Z0-9]+)'
-        ]
-
-        for pattern in trunk_patterns:
-            match = re.search(pattern, room_name, re.IGNORECASE)
+        for pattern in _TRUNK_ID_RES:
+            match = pattern.search(room_name)
             if match and not sip_data.get("sip_trunk_id"):
                 sip_data["sip_trunk_id"] = match.group(1)
                 break
@@ -347,6 +381,11 @@ def log_all_available_data(ctx):
     Args:
         ctx: The JobContext object
     """
+    # The dump walks every attribute of the context; only pay for it when
+    # debugging (AGENT_DEBUG=1 or DEBUG logging)
+    if os.getenv("AGENT_DEBUG") != "1" and not logger.isEnabledFor(logging.DEBUG):
+        return
+
     logger.info("=== COMPREHENSIVE ROOM DATA DEBUG ===")
 
     try:
@@ -7,11 +7,16 @@ providing automatic call termination when thresholds are exceeded.
 
 import asyncio
 import logging
-from typing import Optional
+import time
+import weakref
+from typing import Set
 from livekit.agents import AgentSession
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on how long to wait for a farewell message to finish playing
+FAREWELL_PLAYOUT_TIMEOUT_SECONDS = 10
+
 
 class SessionMonitors:
     """Manages call duration and silence monitoring for agent sessions"""
@@ -22,10 +27,26 @@ class SessionMonitors:
         Args:
             assistant_instance: The Assistant instance that owns these monitors
         """
-        self._assistant = assistant_instance
-        self._call_duration_task: Optional[asyncio.Task] = None
-        self._silence_monitor_task: Optional[asyncio.Task] = None
-        self._last_voice_activity_time = asyncio.Event()
+        # Weak reference so running monitor tasks do not keep an abandoned
+        # assistant alive
+        self._assistant_ref = weakref.ref(assistant_instance)
+        self._tasks: Set[asyncio.Task] = set()
+        # Event-loop time of the last detected speech
+        self._last_voice_activity_ts: float = 0.0
+        # Event-loop clock, bound once monitoring starts
+        self._now = time.monotonic
+
+    @property
+    def _assistant(self):
+        """The owning Assistant, or None if it has been garbage collected"""
+        return self._assistant_ref()
+
+    def _spawn(self, coro, name: str) -> asyncio.Task:
+        """Start a monitor task and track it until it finishes"""
+        task = asyncio.create_task(coro, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
 
     def start_monitoring(self,
                          max_call_duration: int = 0,
@@ -38,15 +59,19 @@ class SessionMonitors:
             enable_silence_detection: Whether to enable silence detection
             silence_duration: Maximum silence duration in seconds
         """
+        # Bound method of the running loop's clock; the voice activity handler
+        # calls it on every speech event
+        self._now = asyncio.get_running_loop().time
+
         if max_call_duration > 0:
-            self._call_duration_task = asyncio.create_task(
-                self._monitor_call_duration(max_call_duration)
-            )
+            self._spawn(self._monitor_call_duration(max_call_duration),
+                        "call_duration_monitor")
 
         if enable_silence_detection and silence_duration > 0:
-            self._silence_monitor_task = asyncio.create_task(
-                self._monitor_silence(silence_duration)
-            )
+            # Measure the first silence window from when monitoring starts
+            self._last_voice_activity_ts = self._now()
+            self._spawn(self._monitor_silence(silence_duration),
+                        "silence_monitor")
 
     def setup_voice_activity_handler(self, agent_session: AgentSession):
         """Register voice activity callback with the agent session
@@ -56,20 +81,43 @@ class SessionMonitors:
         """
         def on_voice_activity(is_speaking: bool):
             if is_speaking:
-                self._last_voice_activity_time.set()
-                self._last_voice_activity_time.clear()
+                self._last_voice_activity_ts = self._now()
 
         agent_session.on("voice_activity")(on_voice_activity)
 
     async def cancel_all(self):
-        """Cancel all monitoring tasks"""
-        if self._call_duration_task and not self._call_duration_task.done():
-            self._call_duration_task.cancel()
-            logger.info("Cancelled call duration monitoring task")
+        """Cancel all monitoring tasks
+
+        The calling task is skipped, so a monitor that ends the session is
+        not cancelled part-way through its own shutdown.
+        """
+        current = asyncio.current_task()
+        for task in list(self._tasks):
+            if task is current or task.done():
+                continue
+            task.cancel()
+            logger.info("Cancelled %s task", task.get_name())
+
+    async def _say_farewell(self, agent_session: AgentSession, instructions: str) -> None:
+        """Speak a farewell and wait until it has finished playing
 
-        if self._silence_monitor_task and not self._silence_monitor_task.done():
-            self._silence_monitor_task.cancel()
-            logger.info("Cancelled silence monitoring task")
+        Args:
+            agent_session: The session to speak through
+            instructions: Instructions for generating the farewell
+        """
+        speech = agent_session.generate_reply(
+            instructions=instructions,
+            allow_interruptions=False
+        )
+
+        # Wait for the goodbye message to be spoken and heard
+        logger.info("Waiting for farewell message to complete")
+        try:
+            await asyncio.wait_for(speech.wait_for_playout(),
+                                   timeout=FAREWELL_PLAYOUT_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning("Farewell message did not finish within %ss",
+                           FAREWELL_PLAYOUT_TIMEOUT_SECONDS)
 
     async def _monitor_call_duration(self, max_duration_seconds: int) -> None:
         """
@@ -80,30 +128,27 @@ class SessionMonitors:
         """
         try:
             logger.info(
-                f"Call duration monitor started: {max_duration_seconds}s maximum")
+                "Call duration monitor started: %ss maximum", max_duration_seconds)
             await asyncio.sleep(max_duration_seconds)
 
-            if self._assistant._agent_session:
+            assistant = self._assistant
+            if assistant and assistant._agent_session:
                 logger.info(
                     "Call duration limit reached - sending farewell message")
                 # Inform user that call duration limit reached
-                await self._assistant._agent_session.generate_reply(
-                    instructions="Inform the user that the maximum call duration has been reached and say goodbye politely.",
-                    allow_interruptions=False
+                await self._say_farewell(
+                    assistant._agent_session,
+                    "Inform the user that the maximum call duration has been reached and say goodbye politely."
                 )
 
-                # Allow time for the goodbye message to be spoken and heard
-                logger.info("Waiting for farewell message to complete")
-                await asyncio.sleep(8)
-
                 # End the call
                 logger.info("Ending call due to maximum duration exceeded")
-                await self._assistant.end_session("max_duration_exceeded")
+                await assistant.end_session("max_duration_exceeded")
 
         except asyncio.CancelledError:
             logger.info("Call duration monitor cancelled")
         except Exception as e:
-            logger.exception(f"Error in call duration monitor: {str(e)}")
+            logger.exception("Error in call duration monitor: %s", e)
 
     async def _monitor_silence(self, silence_duration_seconds: int) -> None:
         """
@@ -114,39 +159,41 @@ class SessionMonitors:
         """
         try:
             logger.info(
-                f"Silence monitor started: {silence_duration_seconds}s threshold")
+                "Silence monitor started: %ss threshold", silence_duration_seconds)
 
+            now = self._now
             while True:
-                # Wait for the silence duration
-                try:
-                    # Wait for voice activity or timeout
-                    await asyncio.wait_for(
-                        self._last_voice_activity_time.wait(),
-                        timeout=silence_duration_seconds
-                    )
-                    # If we reach here, there was voice activity, so reset and continue monitoring
+                # Sleep until the silence window since the last voice
+                # activity would expire, then re-check
+                remaining = silence_duration_seconds - \
+                    (now() - self._last_voice_activity_ts)
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+                    continue
+
+                # No voice activity detected within the silence window; with
+                # no session yet, start a new window and keep monitoring
+                assistant = self._assistant
+                if assistant is None:
+                    break
+                if not assistant._agent_session:
+                    self._last_voice_activity_ts = now()
                     continue
-                except asyncio.TimeoutError:
-                    # No voice activity detected within timeout period
-                    if self._assistant._agent_session:
-                        logger.info(
-                            "Silence timeout reached - sending farewell message")
-                        # Inform user about silence timeout
-                        await self._assistant._agent_session.generate_reply(
-                            instructions="Inform the user that due to lack of activity, you need to end the call, and say goodbye politely.",
-                            allow_interruptions=False
-                        )
-
-                        # Allow time for the goodbye message to be spoken and heard
-                        logger.info("Waiting for farewell message to complete")
-                        await asyncio.sleep(8)
-
-                        # End the call
-                        logger.info("Ending call due to silence timeout")
-                        await self._assistant.end_session("silence_timeout")
-                        break
+
+                logger.info(
+                    "Silence timeout reached - sending farewell message")
+                # Inform user about silence timeout
+                await self._say_farewell(
+                    assistant._agent_session,
+                    "Inform the user that due to lack of activity, you need to end the call, and say goodbye politely."
+                )
+
+                # End the call
+                logger.info("Ending call due to silence timeout")
+                await assistant.end_session("silence_timeout")
+                break
 
         except asyncio.CancelledError:
             logger.info("Silence monitor cancelled")
         except Exception as e:
-            logger.exception(f"Error in silence monitor: {str(e)}")
+            logger.exception("Error in silence monitor: %s", e)
@@ -0,0 +1,78 @@
+"""
+Unit tests for call_history utilities
+"""
+import asyncio
+import unittest
+from unittest.mock import patch, AsyncMock
+
+from utils.call_history import (
+    active_calls,
+    start_call_recording,
+    update_call_stage,
+    end_call_recording,
+    discard_call_recording
+)
+
+
+class TestCallHistory(unittest.TestCase):
+    """Test cases for call_history module"""
+
+    def setUp(self):
+        active_calls.clear()
+
+    def tearDown(self):
+        active_calls.clear()
+
+    def test_update_call_stage_coalesces_repeats(self):
+        """Test repeating the current stage does not add a timeline entry"""
+        async def run():
+            call_id = await start_call_recording("+15637482213", "test-room")
+            for stage in ("greeting", "greeting", "booking", "booking", "greeting"):
+                self.assertTrue(await update_call_stage(call_id, stage))
+            return active_calls[call_id]
+
+        record = asyncio.run(run())
+        self.assertEqual([entry["stage"] for entry in record.stage_timeline],
+                         ["greeting", "booking", "greeting"])
+        self.assertEqual(record.outcomes["final_stage"], "greeting")
+
+    @patch("utils.call_history.send_call_history", new_callable=AsyncMock)
+    def test_end_call_recording_sends_recorded_stages(self, mock_send):
+        """Test ending a call sends the record with its stages and drops it"""
+        mock_send.return_value = {"success": True}
+
+        async def run():
+            call_id = await start_call_recording("+15637482213", "test-room")
+            await update_call_stage(call_id, "greeting")
+            await update_call_stage(call_id, "booking")
+            return call_id, await end_call_recording(call_id, reason=None)
+
+        call_id, success = asyncio.run(run())
+
+        self.assertTrue(success)
+        self.assertNotIn(call_id, active_calls)
+        sent = mock_send.call_args.args[0]
+        self.assertEqual(sent["call_id"], call_id)
+        self.assertEqual(sent["status"], "completed")
+        self.assertEqual([entry["stage"] for entry in sent["stage_timeline"]],
+                         ["greeting", "booking"])
+
+    @patch("utils.call_history.send_call_history", new_callable=AsyncMock)
+    def test_discard_call_recording(self, mock_send):
+        """Test a discarded recording is dropped without being sent"""
+        async def run():
+            call_id = await start_call_recording("+15637482213", "test-room")
+            discarded = discard_call_recording(call_id)
+            return call_id, discarded, await end_call_recording(call_id)
+
+        call_id, discarded, ended = asyncio.run(run())
+
+        self.assertTrue(discarded)
+        self.assertNotIn(call_id, active_calls)
+        self.assertFalse(discard_call_recording(call_id))
+        self.assertFalse(ended)
+        mock_send.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,7 +11,11 @@ from utils.config_fetcher import (
     extract_phone_from_room_name,
     create_phone_jwt,
     fetch_agent_config_by_phone,
-    get_agent_config_from_room
+    get_agent_config_from_room,
+    clear_agent_config_cache,
+    quick_opt_out_check,
+    _opt_out_config_ids,
+    _config_cache_locks
 )
 
 
@@ -102,6 +106,153 @@ class TestConfigFetcher(unittest.TestCase):
         mock_fetch_config.assert_called_with("+15637482213", "inbound")
         self.assertEqual(config, {"stt": {"model": "test-model"}})
 
+    @patch("utils.config_fetcher.fetch_agent_config_by_phone")
+    def test_get_agent_config_from_room_is_cached(self, mock_fetch_config):
+        """Test repeated lookups for the same number reuse the cached config"""
+        clear_agent_config_cache()
+        mock_fetch_config.return_value = (
+            {"stt": {"model": "test-model"}}, "inbound")
+        metadata = {"direction": "inbound"}
+
+        first = asyncio.run(get_agent_config_from_room(
+            "twilio-+15637482213-ST_first", metadata))
+        second = asyncio.run(get_agent_config_from_room(
+            "twilio-+15637482213-ST_second", metadata))
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_fetch_config.call_count, 1)
+
+        # An explicit refresh bypasses the cache
+        asyncio.run(get_agent_config_from_room(
+            "twilio-+15637482213-ST_third", {"direction": "inbound", "refresh_config": True}))
+        self.assertEqual(mock_fetch_config.call_count, 2)
+        clear_agent_config_cache()
+
+    @patch("utils.config_fetcher.CONFIG_CACHE_MAX_ENTRIES", 1)
+    @patch("utils.config_fetcher.fetch_agent_config_by_phone")
+    def test_config_cache_evicts_least_recently_used(self, mock_fetch_config):
+        """Test the config cache is bounded to CONFIG_CACHE_MAX_ENTRIES"""
+        clear_agent_config_cache()
+        mock_fetch_config.return_value = (
+            {"stt": {"model": "test-model"}}, "inbound")
+        metadata = {"direction": "inbound"}
+
+        asyncio.run(get_agent_config_from_room(
+            "twilio-+15637482213-ST_first", metadata))
+        asyncio.run(get_agent_config_from_room(
+            "twilio-+33644644937-ST_second", metadata))
+        # The first number was evicted when the second was cached
+        asyncio.run(get_agent_config_from_room(
+            "twilio-+15637482213-ST_third", metadata))
+
+        self.assertEqual(mock_fetch_config.call_count, 3)
+        clear_agent_config_cache()
+
+    @patch("utils.config_fetcher.CONFIG_CACHE_MAX_ENTRIES", 1)
+    @patch("utils.config_fetcher.fetch_agent_config_by_phone")
+    def test_config_cache_locks_are_dropped(self, mock_fetch_config):
+        """Test per-key locks are not kept for failed or evicted lookups"""
+        clear_agent_config_cache()
+        metadata = {"direction": "inbound"}
+
+        # Nothing is cached for a failed lookup, so no lock is kept
+        mock_fetch_config.return_value = ({}, None)
+        asyncio.run(get_agent_config_from_room(
+            "twilio-+15637482213-ST_first", metadata))
+        self.assertEqual(len(_config_cache_locks), 0)
+
+        mock_fetch_config.return_value = (
+            {"stt": {"model": "test-model"}}, "inbound")
+        asyncio.run(get_agent_config_from_room(
+            "twilio-+15637482213-ST_second", metadata))
+        asyncio.run(get_agent_config_from_room(
+            "twilio-+33644644937-ST_first", metadata))
+        # The first number was evicted along with its lock
+        self.assertEqual(list(_config_cache_locks),
+                         [("phone", "+33644644937", "inbound")])
+        clear_agent_config_cache()
+
+    @patch("utils.config_fetcher.fetch_agent_config_by_phone")
+    def test_concurrent_failed_lookups_share_one_lock(self, mock_fetch_config):
+        """Test failed lookups for one key never fetch concurrently"""
+        clear_agent_config_cache()
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fetch(*args):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {}, None
+
+        mock_fetch_config.side_effect = fetch
+        metadata = {"direction": "inbound"}
+
+        async def lookup(delay):
+            await asyncio.sleep(delay)
+            await get_agent_config_from_room(
+                "twilio-+15637482213-ST_first", metadata)
+
+        async def run():
+            # The last lookup arrives while the second is still fetching
+            await asyncio.gather(lookup(0), lookup(0), lookup(0.015))
+
+        asyncio.run(run())
+
+        self.assertEqual(mock_fetch_config.call_count, 3)
+        self.assertEqual(max_in_flight, 1)
+        self.assertEqual(len(_config_cache_locks), 0)
+        clear_agent_config_cache()
+
+    @patch.dict(os.environ, {"OPT_OUT_CONFIG_IDS": "15637482213, conf-1"})
+    def test_quick_opt_out_check_static_ids(self):
+        """Test numbers and conf_ids listed in OPT_OUT_CONFIG_IDS opt out"""
+        clear_agent_config_cache()
+        _opt_out_config_ids.cache_clear()
+        try:
+            self.assertTrue(quick_opt_out_check(
+                "+15637482213", "twilio-+15637482213-ST_first", {"direction": "inbound"}))
+            self.assertTrue(quick_opt_out_check("conf-1", "web-room", {}))
+            # Unknown and not cached: the config has to be fetched
+            self.assertIsNone(quick_opt_out_check(
+                "+33644644937", "twilio-+33644644937-ST_first", {"direction": "inbound"}))
+        finally:
+            _opt_out_config_ids.cache_clear()
+
+    @patch("utils.config_fetcher.fetch_agent_config_by_phone")
+    def test_quick_opt_out_check_uses_cached_config(self, mock_fetch_config):
+        """Test a cached opted-out config is reported without a fetch"""
+        clear_agent_config_cache()
+        mock_fetch_config.return_value = (
+            {"opt_out_sensitive_data": True}, "inbound")
+        metadata = {"direction": "inbound"}
+
+        asyncio.run(get_agent_config_from_room(
+            "twilio-+15637482213-ST_first", metadata))
+
+        self.assertTrue(quick_opt_out_check(
+            "+15637482213", "twilio-+15637482213-ST_second", metadata))
+        clear_agent_config_cache()
+
+    @patch("utils.config_fetcher.fetch_agent_config_by_phone")
+    def test_quick_opt_out_check_matches_call_direction(self, mock_fetch_config):
+        """Test an inbound cache entry does not answer for an outbound call"""
+        clear_agent_config_cache()
+        mock_fetch_config.return_value = (
+            {"opt_out_sensitive_data": False}, "inbound")
+
+        # e.g. the inbound prefetch made while waiting for the caller
+        asyncio.run(get_agent_config_from_room(
+            "twilio-+15637482213-ST_first", {"direction": "inbound"}))
+
+        self.assertFalse(quick_opt_out_check(
+            "+15637482213", "twilio-+15637482213-ST_first", {"direction": "inbound"}))
+        self.assertIsNone(quick_opt_out_check(
+            "+15637482213", "twilio-+15637482213-ST_first", {"direction": "outbound"}))
+        clear_agent_config_cache()
+
 
 if __name__ == "__main__":
     unittest.main()
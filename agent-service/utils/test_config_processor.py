@@ -0,0 +1,69 @@
+"""
+Unit tests for config_processor utilities
+"""
+import os
+import unittest
+from unittest.mock import patch
+
+from utils.config_processor import (
+    ConfigProcessor,
+    DEFAULT_INSTRUCTIONS,
+    default_min_silence_duration
+)
+
+
+class TestConfigProcessor(unittest.TestCase):
+    """Test cases for config_processor module"""
+
+    def setUp(self):
+        default_min_silence_duration.cache_clear()
+
+    def tearDown(self):
+        default_min_silence_duration.cache_clear()
+
+    def test_default_min_silence_duration(self):
+        """Test VAD_MIN_SILENCE_MS is read as milliseconds"""
+        test_cases = [
+            ("300", 0.3),
+            ("200.0", 0.2),
+            # Invalid values fall back to the 200 ms default
+            ("0.2s", 0.2),
+            ("-50", 0.2),
+            ("nan", 0.2),
+        ]
+
+        for raw, expected in test_cases:
+            default_min_silence_duration.cache_clear()
+            with patch.dict(os.environ, {"VAD_MIN_SILENCE_MS": raw}):
+                self.assertAlmostEqual(default_min_silence_duration(), expected,
+                                       msg=f"Failed for value: {raw}")
+
+        default_min_silence_duration.cache_clear()
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertAlmostEqual(default_min_silence_duration(), 0.2)
+
+    def test_prepare_instructions_canonical_form(self):
+        """Test instructions are NFC-normalized with BOMs, CRLFs and
+        surrounding whitespace removed"""
+        test_cases = [
+            # Decomposed "e" + combining acute accent becomes a single code point
+            ("Cafe\u0301 assistant", "Caf\u00e9 assistant"),
+            ("\ufeffYou are helpful.", "You are helpful."),
+            ("Line one\r\nLine two", "Line one\nLine two"),
+            ("  \n You are helpful.\n\t ", "You are helpful."),
+            ("\ufeff  Cafe\u0301\r\n", "Caf\u00e9"),
+        ]
+
+        for raw, expected in test_cases:
+            self.assertEqual(
+                ConfigProcessor.prepare_instructions({"assistant_instruction": raw}),
+                expected, f"Failed for instructions: {raw!r}")
+
+    def test_prepare_instructions_default(self):
+        """Test the default instructions are used when none are configured"""
+        self.assertEqual(ConfigProcessor.prepare_instructions({}),
+                         DEFAULT_INSTRUCTIONS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Unit tests for session_monitors utilities
+"""
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from utils.session_monitors import SessionMonitors
+
+
+class FakeAgentSession:
+    """AgentSession stand-in recording event handlers and farewells"""
+
+    def __init__(self):
+        self.handlers = {}
+        self.replies = []
+
+    def on(self, event):
+        def register(handler):
+            self.handlers[event] = handler
+            return handler
+        return register
+
+    def generate_reply(self, instructions, allow_interruptions=True):
+        self.replies.append(instructions)
+        speech = MagicMock()
+        speech.wait_for_playout = AsyncMock()
+        return speech
+
+
+class FakeAssistant:
+    """Assistant stand-in owning the session and ending it on request"""
+
+    def __init__(self):
+        self._agent_session = FakeAgentSession()
+        self.end_session = AsyncMock()
+
+
+class TestSessionMonitors(unittest.TestCase):
+    """Test cases for session_monitors module"""
+
+    def test_silence_monitor_fires_after_timeout(self):
+        """Test the call is ended once no voice activity is seen in time"""
+        assistant = FakeAssistant()
+
+        async def run():
+            monitors = SessionMonitors(assistant)
+            monitors.start_monitoring(
+                enable_silence_detection=True, silence_duration=0.05)
+            await asyncio.sleep(0.15)
+            await monitors.cancel_all()
+
+        asyncio.run(run())
+
+        assistant.end_session.assert_awaited_once_with("silence_timeout")
+        self.assertEqual(len(assistant._agent_session.replies), 1)
+
+    def test_silence_monitor_resets_on_voice_activity(self):
+        """Test voice activity restarts the silence window"""
+        assistant = FakeAssistant()
+
+        async def run():
+            monitors = SessionMonitors(assistant)
+            monitors.start_monitoring(
+                enable_silence_detection=True, silence_duration=0.1)
+            monitors.setup_voice_activity_handler(assistant._agent_session)
+            on_voice_activity = assistant._agent_session.handlers["voice_activity"]
+
+            await asyncio.sleep(0.07)
+            on_voice_activity(True)
+            # Past the original window, but within the restarted one
+            await asyncio.sleep(0.07)
+            ended_early = assistant.end_session.await_count
+
+            await asyncio.sleep(0.1)
+            await monitors.cancel_all()
+            return ended_early
+
+        ended_early = asyncio.run(run())
+
+        self.assertEqual(ended_early, 0)
+        assistant.end_session.assert_awaited_once_with("silence_timeout")
+
+
+if __name__ == "__main__":
+    unittest.main()